@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`analysis`
+====================================================
+
+Vectorized analysis of captured port samples with NumPy, for CPython.
+
+Samples are the successive values of `gpio`, given as an ``array('H')`` (or
+``array('B')`` for the 8 pin expanders), a NumPy array, a list of integers,
+or raw bytes as read from the chip with `MCP23XXX.readinto`, port A first.
+Pin ``n`` is bit ``n`` of each sample.  Every function works on the whole
+capture at once, so captures of millions of samples take milliseconds
+instead of the seconds a Python loop over the samples would.
+
+Install NumPy with the ``optional`` extra to use this module.
+
+* Author(s): Adafruit Industries
+"""
+
+import numpy as np
+
+try:
+    from typing import Any, Tuple
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+# Raw register bytes are read port A first, i.e. little-endian.
+_DTYPES = {8: np.dtype(np.uint8), 16: np.dtype("<u2")}
+
+
+def samples_array(samples: Any, width: int = 16) -> np.ndarray:
+    """Returns the samples as a one dimensional NumPy array of unsigned
+    ``width`` bit integers, without copying them where possible.
+
+    :param samples: The captured samples.
+    :param int width: The number of pins per sample, 16 or 8.
+    """
+    if width not in _DTYPES:
+        raise ValueError("Width must be 8 or 16.")
+    dtype = _DTYPES[width]
+    if not isinstance(samples, np.ndarray):
+        try:
+            view = memoryview(samples)
+        except TypeError:
+            return np.asarray(samples, dtype=dtype)
+        if view.itemsize == 1:
+            return np.frombuffer(view, dtype=dtype)
+        samples = np.asarray(view)
+    return samples.reshape(-1).astype(dtype, copy=False)
+
+
+def unpack_bits(samples: Any, width: int = 16) -> np.ndarray:
+    """Returns the pin levels as an array of shape ``(len(samples), width)``
+    holding 0 or 1, column ``n`` being pin ``n``.
+    """
+    data = samples_array(samples, width)
+    octets = np.ascontiguousarray(data).view(np.uint8)
+    return np.unpackbits(octets.reshape(len(data), width // 8), axis=1, bitorder="little")
+
+
+def changes(samples: Any, width: int = 16) -> np.ndarray:
+    """Returns the bit masks of the pins that changed between each sample
+    and the next, one element shorter than the samples.
+    """
+    data = samples_array(samples, width)
+    return data[1:] ^ data[:-1]
+
+
+def edges(samples: Any, pin: int, width: int = 16) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the indices of the samples where ``pin`` went high and where
+    it went low, i.e. the first sample showing the new level, as a tuple
+    ``(rising, falling)``.
+    """
+    if not 0 <= pin < width:
+        raise ValueError(f"Pin number must be 0-{width - 1}.")
+    levels = (samples_array(samples, width) >> pin) & 1
+    steps = np.diff(levels.astype(np.int8))
+    return np.flatnonzero(steps == 1) + 1, np.flatnonzero(steps == -1) + 1
+
+
+def pulse_widths(samples: Any, pin: int, level: bool = True, width: int = 16) -> np.ndarray:
+    """Returns the lengths, in samples, of the complete pulses at ``level``
+    on ``pin``.  Pulses cut off by the start or the end of the capture are
+    left out.  Multiply by the sample period to get durations.
+    """
+    rising, falling = edges(samples, pin, width)
+    starts, ends = (rising, falling) if level else (falling, rising)
+    if len(starts):
+        ends = ends[ends > starts[0]]
+    count = min(len(starts), len(ends))
+    return ends[:count] - starts[:count]
+
+
+def transition_counts(samples: Any, width: int = 16) -> np.ndarray:
+    """Returns the number of level changes of every pin over the capture,
+    element ``n`` being pin ``n``.
+    """
+    changed = changes(samples, width)
+    return np.array(
+        [np.count_nonzero(changed & (1 << pin)) for pin in range(width)],
+        dtype=np.int64,
+    )
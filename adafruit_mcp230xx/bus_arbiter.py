@@ -0,0 +1,265 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`bus_arbiter`
+====================================================
+
+Shared access to expanders from asyncio coroutines, for CPython hosts
+(e.g. a Raspberry Pi with Blinka).
+
+Register accesses lock the bus and wait for the transfer, which stalls the
+event loop.  A `BusArbiter` queues the register operations of any number of
+coroutines and expanders and executes them, in the order they were
+submitted, on one dedicated I/O thread; the coroutines await the results
+without blocking the loop.  By default the drivers share module-level
+transfer buffers, so every expander gets buffers of its own the first time
+it is used through the arbiter, and expanders used directly elsewhere don't
+share them with the I/O thread.
+
+Operations queued while the thread was busy are taken as one batch.
+Consecutive operations in a batch of the same kind on the same expander
+that continue each other's registers are merged into one burst, e.g. a read
+of GPIOA followed by one of GPIOB, and consecutive operations on one bus
+lock it once.
+
+.. code-block:: python
+
+    arbiter = BusArbiter()
+
+    async def blink(mcp):
+        while True:
+            await arbiter.write(mcp, 0x14, b"\\xff")  # OLATA of an MCP23017
+            await asyncio.sleep(0.5)
+            await arbiter.write(mcp, 0x14, b"\\x00")
+            await asyncio.sleep(0.5)
+
+Once an expander is used through an arbiter, use it only through the
+arbiter.  Register addresses are those of the default IOCON.BANK = 0 layout.
+
+* Author(s): Adafruit Industries
+"""
+
+import asyncio
+import threading
+from collections import deque
+
+from adafruit_mcp230xx.mcp23xxx import _give_own_buffers
+from adafruit_mcp230xx.session import _bus_of, _Session
+
+try:
+    from typing import List, Optional
+
+    from circuitpython_typing import ReadableBuffer
+
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+_READ = 0
+_WRITE = 1
+
+
+class _Operation:
+    """A queued register operation and the future awaiting its result."""
+
+    def __init__(
+        self,
+        mcp: MCP23XXX,
+        kind: int,
+        register: int,
+        data: bytearray,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self.mcp = mcp
+        self.kind = kind
+        self.register = register
+        # The bytes to write, or the buffer to read into.
+        self.data = data
+        self.loop = loop
+        self.future = loop.create_future()
+
+
+def _resolve(future: asyncio.Future, result: Optional[bytes], error: Optional[Exception]) -> None:
+    # Runs on the event loop thread.
+    if future.cancelled():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def _schedule(operation: _Operation, result: Optional[bytes], error: Optional[Exception]) -> None:
+    # Hand the outcome to the loop of the operation.  A loop that was closed
+    # meanwhile has nobody left to tell.
+    try:
+        operation.loop.call_soon_threadsafe(_resolve, operation.future, result, error)
+    except RuntimeError:
+        pass
+
+
+def _merge(batch: List[_Operation]) -> List[List[_Operation]]:
+    # Group runs of operations of one kind on one expander whose registers
+    # follow on from each other.
+    groups = []
+    for operation in batch:
+        if groups:
+            last = groups[-1][-1]
+            if (
+                operation.mcp is last.mcp
+                and operation.kind == last.kind
+                and operation.register == last.register + len(last.data)
+            ):
+                groups[-1].append(operation)
+                continue
+        groups.append([operation])
+    return groups
+
+
+class BusArbiter:
+    """Executes the register operations of coroutines on one I/O thread.
+
+    :param str name: The name of the I/O thread.
+
+    The thread is started right away and runs until `close`.  One arbiter
+    can serve the expanders of several buses and coroutines of several
+    event loops.
+    """
+
+    def __init__(self, name: str = "mcp230xx-bus") -> None:
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        # The expanders given buffers of their own.
+        self._arbitrated = set()
+        self.batches = 0
+        """The number of batches executed."""
+        self.operations = 0
+        """The number of operations executed."""
+        self.transactions = 0
+        """The number of bursts the operations were merged into."""
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BusArbiter":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
+
+    def _submit(self, mcp: MCP23XXX, kind: int, register: int, data: bytearray) -> asyncio.Future:
+        operation = _Operation(mcp, kind, register, data, asyncio.get_running_loop())
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The arbiter is closed.")
+            if mcp not in self._arbitrated:
+                _give_own_buffers(mcp)
+                self._arbitrated.add(mcp)
+            self._queue.append(operation)
+            self._condition.notify()
+        return operation.future
+
+    async def read(self, mcp: MCP23XXX, register: int, length: int = 1) -> bytes:
+        """Read ``length`` consecutive registers of ``mcp``, starting at
+        ``register``.  Returns their values.
+        """
+        if length < 1:
+            raise ValueError("Expected length >= 1!")
+        return await self._submit(mcp, _READ, register, bytearray(length))
+
+    async def write(self, mcp: MCP23XXX, register: int, data: ReadableBuffer) -> None:
+        """Write ``data`` to consecutive registers of ``mcp``, starting at
+        ``register``.  The data is copied, so the buffer can be reused right
+        away.
+        """
+        if not data:
+            raise ValueError("Expected at least one byte!")
+        await self._submit(mcp, _WRITE, register, bytearray(data))
+
+    def close(self) -> None:
+        """Execute the operations queued so far, then stop the I/O thread.
+        Further operations raise `RuntimeError`.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _take(self) -> List[_Operation]:
+        # Wait for operations and take all that are queued.
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            batch = list(self._queue)
+            self._queue.clear()
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take()
+            if not batch:
+                return
+            self.batches += 1
+            self.operations += len(batch)
+            groups = _merge(batch)
+            self.transactions += len(groups)
+            start = 0
+            # Lock each bus once for the consecutive groups on it.
+            while start < len(groups):
+                bus = _bus_of(groups[start][0].mcp._bus_device)
+                end = start + 1
+                while end < len(groups) and _bus_of(groups[end][0].mcp._bus_device) is bus:
+                    end += 1
+                self._execute(groups[start:end])
+                start = end
+
+    def _execute(self, groups: List[List[_Operation]]) -> None:
+        chips = []
+        for group in groups:
+            if group[0].mcp not in chips:
+                chips.append(group[0].mcp)
+        done = 0
+        try:
+            with _Session(chips):
+                for group in groups:
+                    self._transfer(group)
+                    done += 1
+        except Exception as error:
+            # Locking the bus failed; fail the operations not done yet.
+            for group in groups[done:]:
+                for operation in group:
+                    _schedule(operation, None, error)
+
+    @staticmethod
+    def _transfer(group: List[_Operation]) -> None:
+        first = group[0]
+        mcp = first.mcp
+        if len(group) == 1:
+            buf = first.data
+        else:
+            buf = bytearray()
+            for operation in group:
+                buf += operation.data
+        error = None
+        try:
+            if first.kind == _READ:
+                mcp.readinto(first.register, buf)
+            else:
+                mcp.write_from(first.register, buf)
+        except Exception as exception:
+            error = exception
+        offset = 0
+        for operation in group:
+            result = None
+            if first.kind == _READ and error is None:
+                result = bytes(buf[offset : offset + len(operation.data)])
+            offset += len(operation.data)
+            # Callbacks run in the order they were scheduled, so the futures
+            # of each loop resolve in the order of the operations.
+            _schedule(operation, result, error)
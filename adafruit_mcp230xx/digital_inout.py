@@ -15,9 +15,9 @@ Digital input/output of the MCP230xx.
 import digitalio
 
 try:
-    from typing import Optional
+    from typing import Callable, Optional
 
-    from digitalio import Direction, Pull
+    from digitalio import Direction, DriveMode, Pull
 
     from adafruit_mcp230xx.mcp23xxx import MCP23XXX
 except ImportError:
@@ -51,21 +51,54 @@ class DigitalInOut:
     configurations.
     """
 
+    RISING = 1
+    """`irq` trigger on a low to high transition."""
+    FALLING = 2
+    """`irq` trigger on a high to low transition."""
+    BOTH = 3
+    """`irq` trigger on any transition."""
+    LEVEL_LOW = 4
+    """`irq` trigger while the pin is low."""
+    LEVEL_HIGH = 8
+    """`irq` trigger while the pin is high."""
+
     def __init__(self, pin_number: int, mcp230xx: MCP23XXX) -> None:
         """Specify the pin number of the MCP230xx (0...7 for MCP23008, or 0...15
         for MCP23017) and MCP23008 instance.
         """
         self._pin = pin_number
         self._mcp = mcp230xx
+        self._drive_mode = digitalio.DriveMode.PUSH_PULL
 
     # kwargs in switch functions below are _necessary_ for compatibility
     # with DigitalInout class (which allows specifying pull, etc. which
     # is unused by this class).  Do not remove them, instead turn off pylint
     # in this case.
-    def switch_to_output(self, value: bool = False, **kwargs) -> None:
+    def switch_to_output(
+        self,
+        value: bool = False,
+        drive_mode: DriveMode = digitalio.DriveMode.PUSH_PULL,
+        **kwargs,
+    ) -> None:
         """Switch the pin state to a digital output with the provided starting
-        value (True/False for high or low, default is False/low).
+        value (True/False for high or low, default is False/low) and drive
+        mode (see `drive_mode`).
         """
+        if drive_mode == digitalio.DriveMode.OPEN_DRAIN:
+            if not self._mcp._ports:
+                raise ValueError("Open-drain emulation is not supported.")
+            self._drive_mode = drive_mode
+            self._mcp._set_open_drain(self._pin, value)
+            return
+        if drive_mode != digitalio.DriveMode.PUSH_PULL:
+            raise ValueError("Expected PUSH_PULL or OPEN_DRAIN drive mode!")
+        self._drive_mode = drive_mode
+        if self._mcp._ports:
+            # Latch the value, then flip the direction, in a minimum of writes.
+            self._mcp.configure(
+                {self._pin: {"direction": digitalio.Direction.OUTPUT, "value": value}}
+            )
+            return
         self.direction = digitalio.Direction.OUTPUT
         self.value = value
 
@@ -74,6 +107,19 @@ class DigitalInOut:
         pull-up resistor state (optional, no pull-up by default) and input polarity.  Note that
         pull-down resistors are NOT supported!
         """
+        self._drive_mode = digitalio.DriveMode.PUSH_PULL
+        if self._mcp._ports:
+            # One read of the configuration registers and one burst write.
+            self._mcp.configure(
+                {
+                    self._pin: {
+                        "direction": digitalio.Direction.INPUT,
+                        "pull": pull,
+                        "invert_polarity": invert_polarity,
+                    }
+                }
+            )
+            return
         self.direction = digitalio.Direction.INPUT
         self.pull = pull
         self.invert_polarity = invert_polarity
@@ -88,6 +134,9 @@ class DigitalInOut:
 
     @value.setter
     def value(self, val: bool) -> None:
+        if self._drive_mode == digitalio.DriveMode.OPEN_DRAIN:
+            self._mcp._set_open_drain(self._pin, val)
+            return
         if val:
             self._mcp.gpio = _enable_bit(self._mcp.gpio, self._pin)
         else:
@@ -98,6 +147,9 @@ class DigitalInOut:
         """The direction of the pin, either True for an input or
         False for an output.
         """
+        if self._drive_mode == digitalio.DriveMode.OPEN_DRAIN:
+            # Released open-drain pins are inputs to the chip only.
+            return digitalio.Direction.OUTPUT
         if _get_bit(self._mcp.iodir, self._pin):
             return digitalio.Direction.INPUT
         return digitalio.Direction.OUTPUT
@@ -105,12 +157,45 @@ class DigitalInOut:
     @direction.setter
     def direction(self, val: Direction) -> None:
         if val == digitalio.Direction.INPUT:
+            self._drive_mode = digitalio.DriveMode.PUSH_PULL
             self._mcp.iodir = _enable_bit(self._mcp.iodir, self._pin)
         elif val == digitalio.Direction.OUTPUT:
+            if self._drive_mode == digitalio.DriveMode.OPEN_DRAIN:
+                return
             self._mcp.iodir = _clear_bit(self._mcp.iodir, self._pin)
         else:
             raise ValueError("Expected INPUT or OUTPUT direction!")
 
+    @property
+    def drive_mode(self) -> DriveMode:
+        """The drive mode of the pin, either ``DriveMode.PUSH_PULL`` or
+        ``DriveMode.OPEN_DRAIN``.  The chip has no open-drain outputs, so open
+        drain is emulated: the pin's OLAT bit is held low and only its IODIR
+        bit changes, released for high and driven low for low.  A pull-up,
+        internal or external, gives a released line its high level.
+
+        The IODIR and OLAT values last written are reused, so every level
+        change is exactly one register write and the pin is never driven
+        high.  Switching to open drain at a high level releases the pin before
+        clearing its OLAT bit, so it isn't driven low on the way either.  Call
+        `MCP23XXX.invalidate_cache` if the chip may have been reset.  Not
+        supported on the MCP23016.
+        """
+        return self._drive_mode
+
+    @drive_mode.setter
+    def drive_mode(self, val: DriveMode) -> None:
+        if val == self._drive_mode:
+            return
+        if val == digitalio.DriveMode.OPEN_DRAIN:
+            # Keep the level: released if the pin was an input or high.
+            high = _get_bit(self._mcp.iodir, self._pin) or self.value
+            self.switch_to_output(high, drive_mode=val)
+        elif val == digitalio.DriveMode.PUSH_PULL:
+            self.switch_to_output(_get_bit(self._mcp.iodir, self._pin))
+        else:
+            raise ValueError("Expected PUSH_PULL or OPEN_DRAIN drive mode!")
+
     @property
     def pull(self) -> Optional[digitalio.Pull]:
         """Enable or disable internal pull-up resistors for this pin.  A
@@ -160,3 +245,43 @@ class DigitalInOut:
             self._mcp.ipol = _clear_bit(self._mcp.ipol, self._pin)
         else:
             return
+
+    def irq(
+        self,
+        trigger: Optional[int] = BOTH,
+        handler: Optional[Callable[["DigitalInOut"], None]] = None,
+    ) -> None:
+        """Configure the interrupt-on-change of this pin and register a
+        ``handler`` to be called with this pin by
+        `adafruit_mcp230xx.interrupts.process_interrupts` when it fires.
+        ``trigger`` is one of `RISING`, `FALLING`, `BOTH`, `LEVEL_LOW` or
+        `LEVEL_HIGH`, or ``None`` to disable the interrupt of this pin.
+
+        The chip only detects changes, so `RISING` and `FALLING` arm the pin
+        for any change and the direction is checked in software from the
+        level captured in INTCAP.  The GPINTEN, INTCON and DEFVAL bits of the
+        pin are updated together with a single burst write, and only if they
+        change.
+        """
+        if trigger is None:
+            settings = {"interrupt_enable": False}
+        elif trigger in {self.RISING, self.FALLING, self.BOTH}:
+            settings = {"interrupt_enable": True, "interrupt_configuration": False}
+        elif trigger in {self.LEVEL_LOW, self.LEVEL_HIGH}:
+            # Interrupt while the pin differs from DEFVAL.
+            settings = {
+                "interrupt_enable": True,
+                "interrupt_configuration": True,
+                "default_value": trigger == self.LEVEL_LOW,
+            }
+        else:
+            raise ValueError("Expected RISING, FALLING, BOTH, LEVEL_LOW, LEVEL_HIGH or None!")
+        self._mcp.configure({self._pin: settings})
+        if trigger is None or handler is None:
+            self._mcp._irq_handlers.pop(self._pin, None)
+            return
+        # The captured level the handler is called for, None for any, and
+        # whether the pin compares against DEFVAL.
+        level = {self.RISING: 1, self.FALLING: 0}.get(trigger)
+        level_triggered = trigger in {self.LEVEL_LOW, self.LEVEL_HIGH}
+        self._mcp._irq_handlers[self._pin] = (level, handler, self, level_triggered)
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`incremental_encoder`
+====================================================
+
+Quadrature decoding of rotary encoders wired to MCP230xx inputs.
+
+All encoders on one expander are decoded together from interrupt-on-change.
+Every `IncrementalEncoders.update` reads INTF, INTCAP and GPIO in a single
+transaction, then steps each encoder through the level captured at the first
+edge and the current level, so one bus read updates every encoder on the
+chip.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    from typing import Optional, Sequence, Tuple
+
+    import digitalio
+
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+# Count change indexed by (previous A/B state << 2) | new A/B state.  A value
+# of 2 marks a transition where both pins changed, i.e. a step was skipped and
+# the direction can't be told from the levels alone.
+_TRANSITIONS = (0, -1, 1, 2, 1, 0, 2, -1, -1, 2, 0, 1, 2, 1, -1, 0)
+
+
+class IncrementalEncoder:
+    """The position of one encoder of an `IncrementalEncoders` group.  The
+    interface follows ``rotaryio.IncrementalEncoder``, but the position is
+    only updated when the group's `IncrementalEncoders.update` is called.
+    """
+
+    def __init__(self, pin_a: int, pin_b: int, divisor: int = 4) -> None:
+        self._pin_a = pin_a
+        self._pin_b = pin_b
+        self._mask = (1 << pin_a) | (1 << pin_b)
+        self._state = 0
+        self._count = 0
+        self._direction = 1
+        self.divisor = divisor
+        """The number of quadrature states per increment of `position`,
+        4 for most detented encoders."""
+
+    @property
+    def position(self) -> int:
+        """The current position in terms of pulses.  The number of pulses per
+        rotation is defined by the specific hardware and by the divisor.
+        """
+        return self._count // self.divisor
+
+    @position.setter
+    def position(self, value: int) -> None:
+        self._count = value * self.divisor
+
+    def _level(self, port: int) -> int:
+        return (((port >> self._pin_a) & 1) << 1) | ((port >> self._pin_b) & 1)
+
+    def _step(self, port: int) -> None:
+        state = self._level(port)
+        delta = _TRANSITIONS[(self._state << 2) | state]
+        if delta == 2:
+            # Assume the encoder kept turning the way it last did.
+            delta = 2 * self._direction
+        elif delta:
+            self._direction = delta
+        self._count += delta
+        self._state = state
+
+
+class IncrementalEncoders:
+    """Decodes several rotary encoders connected to one expander.
+
+    :param MCP23XXX mcp: The expander the encoders are wired to.
+    :param Sequence[Tuple[int, int]] pins: The (A, B) pin numbers of each encoder.
+    :param int divisor: Initial `IncrementalEncoder.divisor` of every encoder.
+    :param digitalio.DigitalInOut interrupt: Optional host input connected to
+        the expander's (mirrored) interrupt pin.  When given, `update` skips
+        the bus read while no interrupt is pending.
+
+    The encoder pins are configured as inputs with pull-ups and
+    interrupt-on-change enabled.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP23XXX,
+        pins: Sequence[Tuple[int, int]],
+        divisor: int = 4,
+        interrupt: Optional[digitalio.DigitalInOut] = None,
+    ) -> None:
+        self._mcp = mcp
+        self._interrupt = interrupt
+        self._encoders = [IncrementalEncoder(pin_a, pin_b, divisor) for pin_a, pin_b in pins]
+        mask = 0
+        for encoder in self._encoders:
+            mask |= encoder._mask
+        mcp.iodir |= mask
+        mcp.gppu |= mask
+        mcp.interrupt_configuration &= ~mask
+        mcp.interrupt_enable |= mask
+        # Clear any pending interrupt and start from the current levels.
+        gpio = mcp.int_state[2]
+        for encoder in self._encoders:
+            encoder._state = encoder._level(gpio)
+
+    def __getitem__(self, index: int) -> IncrementalEncoder:
+        return self._encoders[index]
+
+    def __len__(self) -> int:
+        return len(self._encoders)
+
+    def update(self) -> bool:
+        """Read the expander's interrupt state once and update the position
+        of every encoder.  Returns ``True`` if the bus was read.
+        """
+        if self._interrupt is not None and self._interrupt.value:
+            return False
+        intf, intcap, gpio = self._mcp.int_state
+        for encoder in self._encoders:
+            if intf & encoder._mask:
+                # INTCAP holds the levels just after the first edge, GPIO the
+                # levels now; stepping through both catches a second edge
+                # that happened before the interrupt was serviced.
+                encoder._step(intcap)
+            encoder._step(gpio)
+        return True
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`interrupt_guard`
+====================================================
+
+Protection of the bus against interrupt storms from chattering inputs.
+
+An `InterruptGuard` sits between the expander's interrupt pin and the
+handlers registered with `DigitalInOut.irq`.  The host interrupt only marks
+the interrupt as pending; `InterruptGuard.service` then reads the expander at
+most once per coalescing window, so a burst of edges costs one bus read and
+the transitions behind it are dispatched as one batch.  The chip keeps its
+interrupt output asserted until it is read, so no edge is lost in between.
+
+Pins that cause more events per second than the rate threshold are masked
+by clearing their GPINTEN bit for a while, and their events are dropped
+until the mask expires.  The counters (`InterruptGuard.notifications`,
+`InterruptGuard.services`, `InterruptGuard.dropped`,
+`InterruptGuard.mask_counts` ...) show how much the guard had to step in.
+
+.. code-block:: python
+
+    guard = InterruptGuard(mcp, window=0.01, max_rate=50)
+    GPIO.add_event_detect(17, GPIO.FALLING, callback=guard.notify)
+    while True:
+        guard.service()
+        ...
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+from adafruit_mcp230xx.interrupts import _dispatch, interrupt_events
+
+try:
+    from typing import Dict, List, Optional
+
+    import digitalio
+
+    from adafruit_mcp230xx.interrupts import InterruptEvent
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+
+class InterruptGuard:
+    """Coalesces and rate limits the interrupt service of one expander.
+
+    :param MCP23XXX mcp: The expander to service.
+    :param float window: The shortest time, in seconds, between two
+        services.  Interrupts arriving within it are handled together.
+    :param float max_rate: The most events per second a pin may cause before
+        it is masked.
+    :param float mask_time: How long, in seconds, a pin stays masked.
+    :param float period: The length of the periods, in seconds, over which
+        the event rate of each pin is measured.
+    :param digitalio.DigitalInOut interrupt: Optional host input connected to
+        the expander's (mirrored) interrupt pin, active low.  When given, its
+        level counts as a pending interrupt, so `notify` isn't needed.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP23XXX,
+        window: float = 0.01,
+        max_rate: float = 100,
+        mask_time: float = 1.0,
+        period: float = 1.0,
+        interrupt: Optional[digitalio.DigitalInOut] = None,
+    ) -> None:
+        if window < 0 or max_rate <= 0 or mask_time < 0 or period <= 0:
+            raise ValueError("Expected window, mask_time >= 0 and max_rate, period > 0!")
+        self._mcp = mcp
+        self._interrupt = interrupt
+        self.window = window
+        self.max_rate = max_rate
+        self.mask_time = mask_time
+        self.period = period
+        self._pending = False
+        self._notified = 0
+        self._last_service = None
+        self._period_start = time.monotonic()
+        # Events per pin in the current period, and mask expiry by pin.
+        self._rates = {}
+        self._masked = {}
+        self.notifications = 0
+        """The number of host interrupts reported with `notify`."""
+        self.services = 0
+        """The number of bus reads made to service interrupts."""
+        self.events = 0
+        """The number of events dispatched."""
+        self.dropped = 0
+        """The number of events of masked pins that were dropped."""
+        self.mask_counts = {}
+        """How many times each pin was masked, by pin number."""
+
+    @property
+    def masked(self) -> int:
+        """The bit mask of the pins masked at the moment."""
+        mask = 0
+        for pin in self._masked:
+            mask |= 1 << pin
+        return mask
+
+    def notify(self, *_args) -> None:
+        """Mark an interrupt as pending.  Call this from the host's interrupt
+        callback; it doesn't touch the bus and accepts and ignores any
+        arguments, so it can be registered as the callback directly.
+        """
+        self.notifications += 1
+        if not self._pending:
+            self._notified = time.monotonic_ns()
+            self._pending = True
+
+    def _set_enabled(self, pin: int, enabled: bool) -> None:
+        if self._mcp._ports:
+            self._mcp.configure({pin: {"interrupt_enable": enabled}})
+
+    def _unmask_expired(self, now: float) -> None:
+        for pin, until in list(self._masked.items()):
+            if now >= until:
+                del self._masked[pin]
+                self._set_enabled(pin, True)
+
+    def _account(self, events: List[InterruptEvent], now: float) -> List[InterruptEvent]:
+        # Count the events per pin, mask the pins over the rate and drop the
+        # events of masked pins.
+        if now - self._period_start >= self.period:
+            self._period_start = now
+            self._rates.clear()
+        limit = self.max_rate * self.period
+        rates = self._rates
+        masked = self._masked
+        passed = []
+        for event in events:
+            pin = event.pin
+            if pin in masked:
+                self.dropped += 1
+                continue
+            rates[pin] = rates.get(pin, 0) + 1
+            if rates[pin] > limit:
+                masked[pin] = now + self.mask_time
+                rates[pin] = 0
+                self.mask_counts[pin] = self.mask_counts.get(pin, 0) + 1
+                self._set_enabled(pin, False)
+            passed.append(event)
+        return passed
+
+    def service(self, force: bool = False) -> List[InterruptEvent]:
+        """Service a pending interrupt, unless the previous service was less
+        than `window` ago, and dispatch the events behind it to the handlers
+        registered with `DigitalInOut.irq`.  Call this regularly, e.g. from
+        the main loop.  ``force`` services even without a pending interrupt
+        or within the window.  Returns the events dispatched.
+        """
+        now = time.monotonic()
+        self._unmask_expired(now)
+        pending = self._pending or (self._interrupt is not None and not self._interrupt.value)
+        if not force:
+            if not pending:
+                return []
+            if self._last_service is not None and now - self._last_service < self.window:
+                return []
+        # Service latency is counted from the notification, if there was one.
+        started = self._notified if self._pending else time.monotonic_ns()
+        self._pending = False
+        self._last_service = now
+        self.services += 1
+        events = self._account(interrupt_events(self._mcp), now)
+        self.events += len(events)
+        _dispatch(self._mcp, events)
+        metrics = self._mcp._metrics
+        if metrics is not None:
+            metrics.record_interrupt((time.monotonic_ns() - started) / 1e9)
+        return events
+
+    def unmask(self) -> None:
+        """Re-enable the interrupts of all masked pins right away."""
+        for pin in list(self._masked):
+            del self._masked[pin]
+            self._set_enabled(pin, True)
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """The counters as a dictionary, for logging or export."""
+        return {
+            "notifications": self.notifications,
+            "services": self.services,
+            "events": self.events,
+            "dropped": self.dropped,
+            "masked": self.masked,
+            "masks": sum(self.mask_counts.values()),
+        }
@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`interrupts`
+====================================================
+
+Interrupt servicing: decoding the pin transitions behind an interrupt and
+calling the handlers registered with `DigitalInOut.irq`.
+
+.. code-block:: python
+
+    from adafruit_mcp230xx.interrupts import process_interrupts
+
+    button.irq(DigitalInOut.FALLING, on_press)
+    while True:
+        if not int_pin.value:  # The expander's active low INT output.
+            process_interrupts(mcp)
+
+The decoding needs to know which pins have interrupts enabled, so the
+expander keeps track of its register writes from the first service on.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+from collections import namedtuple
+
+import digitalio
+from micropython import const
+
+try:
+    from typing import List, Optional, Sequence, Tuple
+
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+# Register indices (see mcp23xxx) of GPINTEN, the first of the block read to
+# learn the interrupt configuration, and INTCON.
+_GPINTEN = const(2)
+_INTCON = const(4)
+
+InterruptEvent = namedtuple("InterruptEvent", ("pin", "value", "synthesized"))
+"""A pin transition reported by `interrupt_events`: the pin number, the
+level it changed to and whether the transition was inferred rather than
+captured by the chip."""
+
+
+def _interrupt_configuration(mcp: MCP23XXX) -> Tuple[int, int]:
+    # The GPINTEN and INTCON images, from the register image if it knows
+    # them, otherwise read once and tracked from then on.
+    ports = mcp._ports
+    if not ports:
+        # No GPINTEN register (MCP23016), every pin can interrupt.
+        return 0xFFFF, 0
+    mcp._track_registers()
+    register = _GPINTEN * ports
+    count = (_INTCON - _GPINTEN + 1) * ports
+    mask = ((1 << count) - 1) << register
+    if mcp._shadow_valid & mask == mask:
+        block = mcp._shadow[register : register + count]
+    else:
+        block = mcp._read_block(register, count)
+    enabled = 0
+    compare = 0
+    for port in range(ports):
+        enabled |= block[port] << (8 * port)
+        compare |= block[(_INTCON - _GPINTEN) * ports + port] << (8 * port)
+    return enabled, compare
+
+
+def _decode(mcp: MCP23XXX, intf: int, intcap: int, gpio: int) -> List[InterruptEvent]:
+    # Turn one interrupt state snapshot into pin transitions.  INTCAP only
+    # holds the levels at the first edge, so the current levels and those
+    # seen by the previous service are used to fill in what was missed.
+    # Pins that compare against DEFVAL (INTCON set) keep interrupting while
+    # their level holds, so only what the chip captured is reported for them.
+    last = mcp._irq_levels
+    events = []
+    watched, level_triggered = _interrupt_configuration(mcp)
+    watched |= intf
+    for pin, (_, _, _, compares) in mcp._irq_handlers.items():
+        watched |= 1 << pin
+        if compares:
+            level_triggered |= 1 << pin
+    pin = 0
+    while watched >> pin:
+        bit = 1 << pin
+        if level_triggered & bit:
+            if intf & bit:
+                events.append(InterruptEvent(pin, (intcap >> pin) & 1, False))
+        elif watched & bit:
+            level = (gpio >> pin) & 1
+            if intf & bit:
+                captured = (intcap >> pin) & 1
+                if last is not None and (last >> pin) & 1 == captured:
+                    # The pin moved away and came back before the capture.
+                    events.append(InterruptEvent(pin, captured ^ 1, True))
+                events.append(InterruptEvent(pin, captured, False))
+                if level != captured:
+                    # It changed again after the capture.
+                    events.append(InterruptEvent(pin, level, True))
+            elif last is not None and (last >> pin) & 1 != level:
+                # Changed without being flagged, while another pin's
+                # interrupt was pending.
+                events.append(InterruptEvent(pin, level, True))
+        pin += 1
+    mcp._irq_levels = gpio
+    return events
+
+
+def interrupt_events(mcp: MCP23XXX) -> List[InterruptEvent]:
+    """Service a pending interrupt of ``mcp`` and return the pin transitions
+    behind it as a list of `InterruptEvent`.  INTF, INTCAP and GPIO are read
+    together in a single transaction (see `MCP23XXX.int_state`), which also
+    clears the interrupt.
+
+    The chip only captures the pin levels at the first edge, until INTCAP is
+    read.  Transitions that happened after that, or while another pin's
+    interrupt was pending, are inferred from the current levels and the
+    levels seen by the previous call, and are reported with ``synthesized``
+    set.  An even number of missed transitions on a pin (a complete pulse)
+    can't be seen this way.  Pins that compare against ``default_value`` keep
+    interrupting while their level holds, so only their captured level is
+    reported, and nothing is inferred for them.
+    """
+    return _decode(mcp, *mcp.int_state)
+
+
+def process_interrupts(mcp: MCP23XXX) -> int:
+    """Service a pending interrupt of ``mcp`` and call the handlers
+    registered with `DigitalInOut.irq` for the transitions behind it, as
+    reported by `interrupt_events`, including inferred ones.  Rising or
+    falling only triggers are told apart by the level each transition
+    changed to.  Call this when the expander's interrupt pin fires.  Returns
+    the raw INTF value.
+    """
+    metrics = mcp._metrics
+    if metrics is not None:
+        start = time.monotonic_ns()
+    intf, intcap, gpio = mcp.int_state
+    _dispatch(mcp, _decode(mcp, intf, intcap, gpio))
+    if metrics is not None:
+        metrics.record_interrupt((time.monotonic_ns() - start) / 1e9)
+    return intf
+
+
+def _dispatch(mcp: MCP23XXX, events: List[InterruptEvent]) -> None:
+    # Call the irq() handlers of the pins behind the events.
+    handlers = mcp._irq_handlers
+    for event in events:
+        if event.pin not in handlers:
+            continue
+        level, handler, digital_inout, _ = handlers[event.pin]
+        if level is None or event.value == level:
+            handler(digital_inout)
+
+
+def _arm_change_inputs(mcp: MCP23XXX, pins: Sequence[int], pull: Optional[digitalio.Pull]) -> int:
+    # Make pins inputs that interrupt on any change (just inputs on the
+    # MCP23016, where every pin does), clear any pending change and return
+    # the current levels of all pins.
+    mcp._track_registers()
+    if mcp._ports:
+        settings = {
+            "direction": digitalio.Direction.INPUT,
+            "pull": pull,
+            "interrupt_enable": True,
+            "interrupt_configuration": False,
+        }
+        mcp.configure({pin: settings for pin in pins})
+    else:
+        mask = 0
+        for pin in pins:
+            mask |= 1 << pin
+        mcp.iodir |= mask
+    interrupt_events(mcp)
+    return mcp._irq_levels
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`latched_input`
+====================================================
+
+Latched input reads, so a slow poller still sees short pulses.
+
+The chip's interrupt-on-change logic is used as a latch: the first change of
+an armed pin sets its INTF flag and captures the levels in INTCAP, and both
+hold until they are read.  `LatchedInputs.read` gets INTF, INTCAP and GPIO in
+a single transaction and reports, per pin, the current level, whether it
+changed since the previous read and the captured level, without an interrupt
+handler or a wired interrupt pin.
+
+Reading INTCAP and GPIO clears the chip's pending interrupt, so don't mix
+this with other interrupt consumers of the same expander.
+
+* Author(s): Adafruit Industries
+"""
+
+from collections import namedtuple
+
+import digitalio
+
+from adafruit_mcp230xx.interrupts import _arm_change_inputs
+
+try:
+    from typing import Optional, Sequence
+
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+LatchedState = namedtuple("LatchedState", ("level", "changed", "captured"))
+"""The result of `LatchedInputs.read`, as bit masks over the pin numbers:
+the current levels, the pins that changed since the previous read, even if
+they have changed back since, and the levels captured at the first change
+(the current level for pins that weren't flagged)."""
+
+
+class LatchedInputs:
+    """Latched reads of several inputs of one expander.
+
+    :param MCP23XXX mcp: The expander the inputs are on.
+    :param Sequence[int] pins: The pins to latch.
+    :param ~digitalio.Pull pull: The pull of the inputs.  Ignored on the
+        MCP23016, which has no pull-ups.
+
+    The pins are configured as inputs with interrupt-on-change enabled.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP23XXX,
+        pins: Sequence[int],
+        pull: Optional[digitalio.Pull] = None,
+    ) -> None:
+        self._mcp = mcp
+        mask = 0
+        for pin in pins:
+            mask |= 1 << pin
+        self._mask = mask
+        # Start from the current levels.
+        self._level = _arm_change_inputs(mcp, pins, pull) & mask
+
+    @property
+    def mask(self) -> int:
+        """The bit mask of the latched pins."""
+        return self._mask
+
+    def read(self) -> LatchedState:
+        """Read the latched pins with a single transaction, which also
+        re-arms the latch.  Returns a `LatchedState`.
+        """
+        mask = self._mask
+        intf, intcap, gpio = self._mcp.int_state
+        intf &= mask
+        level = gpio & mask
+        # A flagged pin changed even if it is back at its old level; an
+        # unflagged one may have changed while another pin's flag was set.
+        changed = intf | (level ^ self._level)
+        captured = (intcap & intf) | (level & ~intf)
+        self._level = level
+        return LatchedState(level, changed, captured)
@@ -0,0 +1,303 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`linux_i2c`
+====================================================
+
+An I2C bus talking straight to a Linux ``/dev/i2c-N`` adapter with the
+``I2C_RDWR`` ioctl.
+
+`LinuxI2C` implements the parts of the ``busio.I2C`` interface the expander
+classes use, so it can be passed to them in place of a Blinka bus:
+
+.. code-block:: python
+
+    from adafruit_mcp230xx.linux_i2c import LinuxI2C
+    from adafruit_mcp230xx.mcp23017 import MCP23017
+
+    i2c = LinuxI2C(1)
+    mcp = MCP23017(i2c)
+
+On top of that it can pack many messages, for any number of devices on the
+adapter, into a single ioctl: register writes issued inside `LinuxI2C.batch`
+are queued and sent together with the next read, and
+`LinuxI2C.read_registers` reads registers from many devices at once.
+
+The ioctl function can be replaced, so the transport can be exercised against
+a stub, or against the kernel's ``i2c-stub`` module with the real ioctl.
+
+This module is only available on Linux.
+
+* Author(s): Adafruit Industries
+"""
+
+import ctypes
+import os
+import threading
+from fcntl import ioctl as _ioctl
+
+from micropython import const
+
+try:
+    from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+I2C_RDWR = const(0x0707)
+I2C_M_RD = const(0x0001)
+# The kernel refuses I2C_RDWR requests with more messages than this.
+I2C_RDWR_IOCTL_MAX_MSGS = const(42)
+
+
+class _I2CMsg(ctypes.Structure):
+    # struct i2c_msg from <linux/i2c.h>
+    _fields_ = [
+        ("addr", ctypes.c_uint16),
+        ("flags", ctypes.c_uint16),
+        ("len", ctypes.c_uint16),
+        ("buf", ctypes.POINTER(ctypes.c_uint8)),
+    ]
+
+
+class _I2CRdwrIoctlData(ctypes.Structure):
+    # struct i2c_rdwr_ioctl_data from <linux/i2c-dev.h>
+    _fields_ = [
+        ("msgs", ctypes.POINTER(_I2CMsg)),
+        ("nmsgs", ctypes.c_uint32),
+    ]
+
+
+def _span(buf: WriteableBuffer, start: int, end: Optional[int]) -> Tuple[int, int]:
+    if end is None:
+        end = len(buf)
+    return start, end - start
+
+
+def _chunks(
+    messages: Sequence[Tuple[int, WriteableBuffer, bool]],
+) -> List[Sequence[Tuple[int, WriteableBuffer, bool]]]:
+    # Split messages into runs the kernel accepts in one request, keeping a
+    # write and a read of the same device right after it together.
+    chunks = []
+    first = 0
+    index = 0
+    count = len(messages)
+    while index < count:
+        size = 1
+        if (
+            index + 1 < count
+            and not messages[index][2]
+            and messages[index + 1][2]
+            and messages[index + 1][0] == messages[index][0]
+        ):
+            size = 2
+        if index + size - first > I2C_RDWR_IOCTL_MAX_MSGS:
+            chunks.append(messages[first:index])
+            first = index
+        index += size
+    if first < count:
+        chunks.append(messages[first:])
+    return chunks
+
+
+class LinuxI2C:
+    """An I2C bus on a Linux ``/dev/i2c-N`` adapter.
+
+    :param device: The adapter number, or the path of its device node.
+    :param ioctl: The function used to issue ``I2C_RDWR`` requests, called
+        as ``ioctl(fd, I2C_RDWR, data)`` with ``data`` a ctypes
+        ``struct i2c_rdwr_ioctl_data``.  Defaults to ``fcntl.ioctl``.
+    """
+
+    def __init__(
+        self,
+        device: Union[int, str] = 1,
+        *,
+        ioctl: Optional[Callable] = None,
+    ) -> None:
+        if isinstance(device, int):
+            device = f"/dev/i2c-{device}"
+        self._fd = os.open(device, os.O_RDWR)
+        self._ioctl = ioctl or _ioctl
+        self._lock = threading.Lock()
+        # The writes queued by the open batches, by thread.
+        self._pending = {}
+        self.ioctl_count = 0
+        """The number of ``I2C_RDWR`` requests issued so far."""
+
+    def __enter__(self) -> "LinuxI2C":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.deinit()
+
+    def deinit(self) -> None:
+        """Close the adapter."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def try_lock(self) -> bool:
+        """Attempt to grab the lock.  Returns ``True`` on success."""
+        return self._lock.acquire(False)
+
+    def unlock(self) -> None:
+        """Release the lock."""
+        self._lock.release()
+
+    def scan(self) -> List[int]:
+        """Returns a list of the 7-bit addresses that acknowledge an empty write."""
+        found = []
+        for address in range(0x08, 0x78):
+            try:
+                self.transfer(((address, b"", False),))
+            except OSError:
+                continue
+            found.append(address)
+        return found
+
+    def transfer(self, messages: Sequence[Tuple[int, WriteableBuffer, bool]]) -> None:
+        """Execute a sequence of messages as one combined transaction, with a
+        repeated start between them.  Each message is a tuple of the device
+        address, the buffer and ``True`` for a read into the buffer or
+        ``False`` for a write of it.  Longer sequences are split into as few
+        ioctl requests as the kernel accepts, never between a write and the
+        read of the same device that follows it, so no other bus user can
+        get in between a register pointer write and its read.
+        """
+        for chunk in _chunks(messages):
+            msgs = (_I2CMsg * len(chunk))()
+            # Keep the ctypes views alive until the ioctl has returned.
+            views = []
+            for msg, (address, buf, read) in zip(msgs, chunk):
+                if read:
+                    view = (ctypes.c_uint8 * len(buf)).from_buffer(buf)
+                else:
+                    view = (ctypes.c_uint8 * len(buf)).from_buffer_copy(buf)
+                views.append(view)
+                msg.addr = address
+                msg.flags = I2C_M_RD if read else 0
+                msg.len = len(buf)
+                msg.buf = ctypes.cast(view, ctypes.POINTER(ctypes.c_uint8))
+            data = _I2CRdwrIoctlData(msgs, len(chunk))
+            self.ioctl_count += 1
+            self._ioctl(self._fd, I2C_RDWR, data)
+
+    def _flush(self, messages: Sequence[Tuple[int, WriteableBuffer, bool]] = ()) -> None:
+        # Send the writes queued by the batch of the calling thread, if any,
+        # followed by messages.
+        pending = self._pending.get(threading.get_ident())
+        if pending:
+            messages = pending + list(messages)
+            pending.clear()
+        if messages:
+            self.transfer(messages)
+
+    def batch(self) -> "_Batch":
+        """Returns a context manager that queues every write issued inside it.
+        The queued writes go out in the same ioctl as the next read, or when
+        the context exits, so a run of register writes to several devices,
+        followed by a register read, costs a single system call.
+
+        Queued writes are not acknowledged until they are sent, so errors are
+        reported by the read or the exit that sends them.  A batch only
+        queues the writes of the thread that opened it.
+        """
+        return _Batch(self)
+
+    def writeto(
+        self,
+        address: int,
+        buffer: ReadableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Write the bytes from ``buffer`` to the device at ``address``."""
+        start, length = _span(buffer, start, end)
+        data = bytes(buffer[start : start + length])
+        pending = self._pending.get(threading.get_ident())
+        if pending is not None:
+            pending.append((address, data, False))
+            return
+        self.transfer(((address, data, False),))
+
+    def readfrom_into(
+        self,
+        address: int,
+        buffer: WriteableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Read from the device at ``address`` into ``buffer``."""
+        start, length = _span(buffer, start, end)
+        self._flush(((address, memoryview(buffer)[start : start + length], True),))
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write the bytes from ``buffer_out`` to the device at ``address``,
+        then read into ``buffer_in`` after a repeated start, in one request.
+        """
+        out_start, out_length = _span(buffer_out, out_start, out_end)
+        in_start, in_length = _span(buffer_in, in_start, in_end)
+        self._flush(
+            (
+                (address, bytes(buffer_out[out_start : out_start + out_length]), False),
+                (address, memoryview(buffer_in)[in_start : in_start + in_length], True),
+            )
+        )
+
+    def read_registers(self, requests: Sequence[Tuple[int, int, WriteableBuffer]]) -> None:
+        """Read registers from many devices in as few ioctl requests as
+        possible.  Each request is a tuple of the device address, the first
+        register and the buffer to read into; the buffer length sets how many
+        consecutive registers are read.  Queued batch writes are sent first.
+        The bus is locked meanwhile, so don't call this while holding the lock.
+        """
+        messages = []
+        for address, register, buf in requests:
+            messages.append((address, bytes((register,)), False))
+            messages.append((address, buf, True))
+        with self._lock:
+            self._flush(messages)
+
+
+class _Batch:
+    def __init__(self, bus: LinuxI2C) -> None:
+        self._bus = bus
+        self._outermost = False
+        self._thread = None
+
+    def __enter__(self) -> LinuxI2C:
+        # Nested batches leave the flushing to the outermost one.
+        self._thread = threading.get_ident()
+        if self._thread not in self._bus._pending:
+            self._bus._pending[self._thread] = []
+            self._outermost = True
+        return self._bus
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        if not self._outermost:
+            return
+        try:
+            if exception_type is None:
+                self._bus._flush()
+        finally:
+            del self._bus._pending[self._thread]
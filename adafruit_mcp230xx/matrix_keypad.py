@@ -0,0 +1,249 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`matrix_keypad`
+====================================================
+
+Interrupt driven key matrix scanning for the MCP23017 and MCP23S17.
+
+The rows of the matrix are wired to port A, the columns are wired to port B
+as inputs with the internal pull-ups enabled.  The row latches are held low
+and a row is either driven low (an output) or released (an input).  While no
+key is held every row is driven low and interrupt-on-change is armed on the
+columns, so an idle keypad costs no bus traffic at all when the expander's
+interrupt pin is connected.  Once a column interrupt fires the matrix is
+scanned one row at a time, each row step being a write of IODIRA that drives
+only that row, and a read of the column port.  Rows are never driven high, so
+holding several keys in one column doesn't short two outputs.
+
+Events are reported through a queue that mirrors the ``keypad.EventQueue``
+interface of CircuitPython.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+from micropython import const
+
+try:
+    from typing import Optional, Sequence
+
+    import digitalio
+
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+try:
+    from keypad import Event
+except ImportError:
+
+    class Event:
+        """A key transition event, compatible with ``keypad.Event``."""
+
+        def __init__(self, key_number: int = 0, pressed: bool = True, timestamp: int = None):
+            self.key_number = key_number
+            self.pressed = pressed
+            self.timestamp = timestamp
+
+        @property
+        def released(self) -> bool:
+            """``True`` if the event represents a key up (released) transition."""
+            return not self.pressed
+
+        def __eq__(self, other: object) -> bool:
+            # Timestamps are ignored, as they are for ``keypad.Event``.
+            return (
+                isinstance(other, Event)
+                and self.key_number == other.key_number
+                and self.pressed == other.pressed
+            )
+
+        def __hash__(self) -> int:
+            return hash((self.key_number, self.pressed))
+
+        def __repr__(self) -> str:
+            state = "pressed" if self.pressed else "released"
+            return f"<Event: key_number {self.key_number} {state}>"
+
+
+try:
+    from supervisor import ticks_ms
+except ImportError:
+
+    def ticks_ms() -> int:
+        """Millisecond tick counter wrapping like ``supervisor.ticks_ms``."""
+        return (time.monotonic_ns() // 1000000) & 0x3FFFFFFF
+
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+# Register indices of the layout shared with `adafruit_mcp230xx.mcp23xxx`
+# (private constants can't be imported once compiled).  Register n of port p
+# lives at address n * _ports + p.
+_IODIR = const(0)
+_IPOL = const(1)
+_GPINTEN = const(2)
+_INTCON = const(4)
+_GPPU = const(6)
+_INTF = const(7)
+_GPIO = const(9)
+_OLAT = const(10)
+
+
+class EventQueue:
+    """A bounded queue of key `Event` objects.  The interface is the same as
+    ``keypad.EventQueue``, except that ``get_into()`` is not supported.
+    """
+
+    def __init__(self, max_events: int = 64) -> None:
+        self._events = []
+        self._max_events = max_events
+        self.overflowed = False
+        """``True`` if an event could not be queued because the queue was full.
+        Cleared by `clear`."""
+
+    def get(self) -> Optional[Event]:
+        """Remove and return the oldest event, or ``None`` if the queue is empty."""
+        if self._events:
+            return self._events.pop(0)
+        return None
+
+    def clear(self) -> None:
+        """Discard all queued events and reset `overflowed`."""
+        self._events.clear()
+        self.overflowed = False
+
+    def _record(self, key_number: int, pressed: bool, timestamp: int) -> None:
+        if len(self._events) >= self._max_events:
+            self.overflowed = True
+            return
+        self._events.append(Event(key_number, pressed, timestamp))
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __bool__(self) -> bool:
+        return bool(self._events)
+
+
+class MatrixKeypad:
+    """Scans a key matrix with rows on port A and columns on port B of an
+    MCP23017 or MCP23S17.
+
+    :param MCP23XXX mcp: The expander the matrix is wired to.
+    :param Sequence[int] row_pins: Port A pin numbers (0-7) driving the rows.
+    :param Sequence[int] column_pins: Port B pin numbers (8-15) reading the columns.
+    :param digitalio.DigitalInOut interrupt: Optional host input connected to
+        the expander's INTB pin.  When given, an idle keypad is detected
+        without any bus transaction; otherwise INTFB is polled once per
+        `update` while no key is held.
+    :param int max_events: Size of the event queue.
+
+    Key numbers are assigned row by row, like ``keypad.KeyMatrix``:
+    ``key_number = row * len(column_pins) + column``.
+
+    Rows that are not being scanned are released to high impedance and the
+    column pull-ups keep the columns of unpressed keys high.  Polarity
+    inversion (IPOLB) set on the columns is left in place and accounted for.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP23XXX,
+        row_pins: Sequence[int],
+        column_pins: Sequence[int],
+        interrupt: Optional[digitalio.DigitalInOut] = None,
+        max_events: int = 64,
+    ) -> None:
+        if mcp._ports != 2:
+            raise ValueError("Expected an MCP23017 or MCP23S17.")
+        if not all(0 <= pin <= 7 for pin in row_pins):
+            raise ValueError("Row pins must be on port A (0-7).")
+        if not all(8 <= pin <= 15 for pin in column_pins):
+            raise ValueError("Column pins must be on port B (8-15).")
+        self._mcp = mcp
+        self._interrupt = interrupt
+        ports = mcp._ports
+        # Port A and port B addresses of the registers used.
+        self._iodira = _IODIR * ports
+        self._iodirb = _IODIR * ports + 1
+        self._intfb = _INTF * ports + 1
+        self._gpioa = _GPIO * ports
+        self._gpiob = _GPIO * ports + 1
+        self._row_bits = [1 << pin for pin in row_pins]
+        self._column_bits = [1 << (pin - 8) for pin in column_pins]
+        self._row_mask = sum(self._row_bits)
+        self._column_mask = sum(self._column_bits)
+        self._pressed = [False] * (len(row_pins) * len(column_pins))
+        self._keys_down = 0
+        self.events = EventQueue(max_events)
+        """The `EventQueue` key transitions are reported to."""
+
+        # Latch the rows low before turning them into outputs so they never
+        # glitch high, then make the columns pulled-up inputs that interrupt
+        # on any change.
+        mcp._write_u8(self._gpioa, mcp._read_u8(_OLAT * ports) & ~self._row_mask)
+        # IODIRA with every row driven low, the idle state.
+        self._iodir = mcp._read_u8(self._iodira) & ~self._row_mask
+        mcp._write_u8(self._iodira, self._iodir)
+        mcp._write_u8(self._iodirb, mcp._read_u8(self._iodirb) | self._column_mask)
+        mcp._write_u8(_GPPU * ports + 1, mcp._read_u8(_GPPU * ports + 1) | self._column_mask)
+        # Columns with inverted polarity read high when pulled low.
+        self._invert = mcp._read_u8(_IPOL * ports + 1) & self._column_mask
+        mcp._write_u8(_INTCON * ports + 1, mcp._read_u8(_INTCON * ports + 1) & ~self._column_mask)
+        mcp._write_u8(_GPINTEN * ports + 1, mcp._read_u8(_GPINTEN * ports + 1) | self._column_mask)
+        # Reading the column port clears any interrupt left over from setup.
+        mcp._read_u8(self._gpiob)
+
+    @property
+    def key_count(self) -> int:
+        """The number of keys in the matrix."""
+        return len(self._pressed)
+
+    def _pending(self) -> bool:
+        if self._interrupt is not None:
+            # INTB is open-drain or active-low push-pull.
+            return not self._interrupt.value
+        return bool(self._mcp._read_u8(self._intfb) & self._column_mask)
+
+    def update(self) -> bool:
+        """Scan the matrix if a column interrupt is pending or a key is held,
+        and queue an event for every key that changed state.  Call this
+        regularly, for example from the main loop.  Returns ``True`` if the
+        matrix was scanned.
+        """
+        if not self._keys_down and not self._pending():
+            return False
+        timestamp = ticks_ms()
+        mcp = self._mcp
+        keys_down = 0
+        key_number = 0
+        for row_bit in self._row_bits:
+            # Drive only this row low, release every other one.
+            mcp._write_u8(self._iodira, self._iodir | (self._row_mask ^ row_bit))
+            state = mcp._read_u8(self._gpiob) ^ self._invert
+            for column_bit in self._column_bits:
+                pressed = not state & column_bit
+                if pressed != self._pressed[key_number]:
+                    self._pressed[key_number] = pressed
+                    self.events._record(key_number, pressed, timestamp)
+                keys_down += pressed
+                key_number += 1
+        # Back to idle with all rows low.  Reading the columns here also clears
+        # the interrupts the scan itself caused.
+        mcp._write_u8(self._iodira, self._iodir)
+        mcp._read_u8(self._gpiob)
+        self._keys_down = keys_down
+        return True
+
+    def reset(self) -> None:
+        """Forget the state of all keys.  Keys that are held down will be
+        reported as pressed again by the next `update`.
+        """
+        self._pressed = [False] * len(self._pressed)
+        self._keys_down = len(self._pressed)
@@ -54,6 +54,8 @@ class MCP23008(MCP230XX):
     at the specified I2C address.
     """
 
+    _ports = 1
+
     def __init__(self, i2c: I2C, address: int = _MCP23008_ADDRESS, reset: bool = True) -> None:
         super().__init__(i2c, address)
 
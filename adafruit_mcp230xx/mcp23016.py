@@ -18,6 +18,11 @@ Notes
 While the datasheet refers to the two 8-bit ports as port 0 and 1,
 for API compatibility with more recent expanders, these are exposed as
 ports A and B.
+
+The MCP23016 interrupts on any change of an input pin and has no interrupt
+flag register, so the pins that caused an interrupt are worked out by
+comparing the captured levels with the levels seen by the previous
+interrupt service.
 """
 
 from micropython import const
@@ -26,7 +31,7 @@ from .digital_inout import DigitalInOut
 from .mcp230xx import MCP230XX
 
 try:
-    import typing
+    from typing import List, Tuple
 
     from busio import I2C
 except ImportError:
@@ -46,6 +51,7 @@ _MCP23016_INTCAP0 = const(0x08)
 _MCP23016_INTCAP1 = const(0x09)
 _MCP23016_IOCON0 = const(0x0A)
 _MCP23016_IOCON1 = const(0x0B)
+_MCP23016_IARES = const(0x01)
 
 
 class MCP23016(MCP230XX):
@@ -55,6 +61,9 @@ class MCP23016(MCP230XX):
 
     def __init__(self, i2c: I2C, address: int = _MCP23016_ADDRESS, reset: bool = True) -> None:
         super().__init__(i2c, address)
+        # Pin levels seen by the last interrupt service, for int_flag, None
+        # before the first.
+        self._int_levels = None
 
         if reset:
             # Reset to all inputs and no inverted polarity.
@@ -138,6 +147,87 @@ class MCP23016(MCP230XX):
             raise ValueError("Pin number must be 0-15.")
         return DigitalInOut(pin, self)
 
+    @property
+    def io_control(self) -> int:
+        """The raw IOCON0 configuration register.  Bit 0 (IARES) selects the
+        interrupt activity resolution (1 = fast, 0 = normal), all other bits
+        are unused.
+        """
+        return self._read_u8(_MCP23016_IOCON0)
+
+    @io_control.setter
+    def io_control(self, val: int) -> None:
+        self._write_u8(_MCP23016_IOCON0, val & _MCP23016_IARES)
+
+    @property
+    def fast_interrupt_resolution(self) -> bool:
+        """Whether the fast interrupt activity resolution is selected.  The
+        chip samples its inputs for changes every 32 ms by default; the fast
+        mode samples every 200 us, bringing the interrupt latency close to
+        that of the newer expanders at the cost of a higher supply current.
+        """
+        return bool(self.io_control & _MCP23016_IARES)
+
+    @fast_interrupt_resolution.setter
+    def fast_interrupt_resolution(self, val: bool) -> None:
+        self.io_control = _MCP23016_IARES if val else 0
+
+    @property
+    def int_flag(self) -> List[int]:
+        """Returns a list with the pin numbers that changed, according to the
+        levels captured at the time of the interrupt, since the previous
+        interrupt service.  This reads INTCAP, which clears the interrupt.
+        port 0 ----> pins 0-7
+        port 1 ----> pins 8-15
+        """
+        intf = self.int_state[0]
+        return [pin for pin in range(16) if intf & (1 << pin)]
+
+    @property
+    def int_cap(self) -> List[int]:
+        """Returns a list with the pin values at time of interrupt
+        port 0 ----> pins 0-7
+        port 1 ----> pins 8-15
+        """
+        intcap = self._read_u16le(_MCP23016_INTCAP0)
+        return [(intcap >> pin) & 1 for pin in range(16)]
+
+    @property
+    def int_capa(self) -> List[int]:
+        """Returns a list of pin values at time of interrupt
+        pins: 0-7
+        """
+        intcapa = self._read_u8(_MCP23016_INTCAP0)
+        return [(intcapa >> pin) & 1 for pin in range(8)]
+
+    @property
+    def int_capb(self) -> List[int]:
+        """Returns a list of pin values at time of interrupt
+        pins: 8-15
+        """
+        intcapb = self._read_u8(_MCP23016_INTCAP1)
+        return [(intcapb >> pin) & 1 for pin in range(8)]
+
+    @property
+    def int_state(self) -> Tuple[int, int, int]:
+        """Returns a tuple of the interrupt flags, the raw INTCAP register and
+        the raw GPIO register, each 16 bits wide with port 0 in the low byte.
+        The MCP23016 has no INTF register, so the flags are the pins whose
+        captured level differs from the level seen by the previous call, none
+        on the first call.
+        INTCAP is read as one 16-bit value, which clears the interrupt, and
+        GPIO in a second transaction; the chip can't read both in one.
+        """
+        intcap = self._read_u16le(_MCP23016_INTCAP0)
+        gpio = self._read_u16le(_MCP23016_GPIO0)
+        intf = 0 if self._int_levels is None else intcap ^ self._int_levels
+        self._int_levels = gpio
+        return intf, intcap, gpio
+
+    def clear_ints(self) -> None:
+        """Clears interrupts by reading INTCAP."""
+        self._read_u16le(_MCP23016_INTCAP0)
+
     def clear_inta(self) -> None:
         """Clears port 0 interrupts."""
         self._read_u8(_MCP23016_INTCAP0)
@@ -63,6 +63,8 @@ class MCP23017(MCP230XX):
     at the specified I2C address.
     """
 
+    _ports = 2
+
     def __init__(self, i2c: I2C, address: int = _MCP23017_ADDRESS, reset: bool = True) -> None:
         super().__init__(i2c, address)
         if reset:
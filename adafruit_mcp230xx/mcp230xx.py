@@ -15,47 +15,95 @@ CircuitPython module for the MCP23017 and MCP23008 I2C I/O extenders.
 
 from .mcp23xxx import MCP23XXX
 
+try:
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
 
 # Global buffer for reading and writing registers with the devices.  This is
 # shared between both the MCP23008 and MCP23017 class to reduce memory allocations.
-# However this is explicitly not thread safe or re-entrant by design!
+# However this is explicitly not thread safe or re-entrant by design!  Instances
+# that are accessed from several threads get a buffer of their own by assigning
+# a new bytearray(3) to their _buffer attribute.
 _BUFFER = bytearray(3)
 
 
 class MCP230XX(MCP23XXX):
     """Base class for MCP230xx devices."""
 
+    _buffer = _BUFFER
+    # IOCON.HAEN, the address pins of the I2C chips are always enabled.
+    _IOCON_SENTINEL = 0x08
+    _TRANSPORT = MCP23XXX._TRANSPORT + ("_write_u8_read_u8",)
+
     def _read_u16le(self, register: int) -> int:
         # Read an unsigned 16 bit little endian value from the specified 8-bit
         # register.
+        buffer = self._buffer
         with self._device as bus_device:
-            _BUFFER[0] = register & 0xFF
+            buffer[0] = register & 0xFF
 
-            bus_device.write_then_readinto(_BUFFER, _BUFFER, out_end=1, in_start=1, in_end=3)
-            return (_BUFFER[2] << 8) | _BUFFER[1]
+            bus_device.write_then_readinto(buffer, buffer, out_end=1, in_start=1, in_end=3)
+            return (buffer[2] << 8) | buffer[1]
 
     def _write_u16le(self, register: int, val: int) -> None:
         # Write an unsigned 16 bit little endian value to the specified 8-bit
         # register.
+        buffer = self._buffer
         with self._device as bus_device:
-            _BUFFER[0] = register & 0xFF
-            _BUFFER[1] = val & 0xFF
-            _BUFFER[2] = (val >> 8) & 0xFF
-            bus_device.write(_BUFFER, end=3)
+            buffer[0] = register & 0xFF
+            buffer[1] = val & 0xFF
+            buffer[2] = (val >> 8) & 0xFF
+            bus_device.write(buffer, end=3)
 
     def _read_u8(self, register: int) -> int:
         # Read an unsigned 8 bit value from the specified 8-bit register.
+        buffer = self._buffer
         with self._device as bus_device:
-            _BUFFER[0] = register & 0xFF
+            buffer[0] = register & 0xFF
 
-            bus_device.write_then_readinto(_BUFFER, _BUFFER, out_end=1, in_start=1, in_end=2)
-            return _BUFFER[1]
+            bus_device.write_then_readinto(buffer, buffer, out_end=1, in_start=1, in_end=2)
+            return buffer[1]
 
     def _write_u8(self, register: int, val: int) -> None:
         # Write an 8 bit value to the specified 8-bit register.
+        buffer = self._buffer
+        with self._device as bus_device:
+            buffer[0] = register & 0xFF
+            buffer[1] = val & 0xFF
+            bus_device.write(buffer, end=2)
+
+    def _readinto(self, register: int, buf: WriteableBuffer) -> None:
+        # Read consecutive registers, starting at the specified 8-bit
+        # register, into buf.
+        buffer = self._buffer
+        with self._device as bus_device:
+            buffer[0] = register & 0xFF
+
+            bus_device.write_then_readinto(buffer, buf, out_end=1)
+
+    def _write_from(self, register: int, buf: ReadableBuffer) -> None:
+        # Write buf to consecutive registers, starting at the specified 8-bit
+        # register.  The register address has to lead the data in a single
+        # write, so this goes through a temporary buffer.
+        data = bytearray(len(buf) + 1)
+        data[0] = register & 0xFF
+        data[1:] = buf
         with self._device as bus_device:
-            _BUFFER[0] = register & 0xFF
-            _BUFFER[1] = val & 0xFF
-            bus_device.write(_BUFFER, end=2)
+            bus_device.write(data)
+
+    def _write_u8_read_u8(self, register: int, val: int) -> int:
+        # Write an 8 bit value to the specified 8-bit register and read the
+        # following register back in the same transaction.  The repeated start
+        # continues from the auto-incremented address pointer, so this only
+        # works with sequential operation enabled (the power-on default).
+        buffer = self._buffer
+        with self._device as bus_device:
+            buffer[0] = register & 0xFF
+            buffer[1] = val & 0xFF
+
+            bus_device.write_then_readinto(buffer, buffer, out_end=2, in_start=2, in_end=3)
+            return buffer[2]
@@ -47,6 +47,8 @@ class MCP23S08(MCP23SXX):
     at the specified I2C address.
     """
 
+    _ports = 1
+
     def __init__(
         self,
         spi: SPI,
@@ -53,6 +53,8 @@ class MCP23S17(MCP23SXX):
     at the specified SPI address.
     """
 
+    _ports = 2
+
     def __init__(
         self,
         spi: SPI,
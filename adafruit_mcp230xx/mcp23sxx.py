@@ -13,13 +13,16 @@ CircuitPython module for the MCP23S17 SPI I/O extenders.
 * Author(s): Romy Bompart (2020), Red_M (2021)
 """
 
+from micropython import const
+
 from .mcp23xxx import MCP23XXX
 
 try:
-    import typing
+    from typing import Sequence
 
     import digitalio
     from busio import SPI
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
 except ImportError:
     pass
 
@@ -27,17 +30,34 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
 
 # shared between both the MCP23S17 class to reduce memory allocations.
-# However this is explicitly not thread safe or re-entrant by design!
+# However this is explicitly not thread safe or re-entrant by design!  Instances
+# that are accessed from several threads get buffers of their own by assigning
+# new bytearray(4)s to their _out_buffer and _in_buffer attributes.
 # Header to start a reading or writting operation
 _OUT_BUFFER = bytearray(4)
 _IN_BUFFER = bytearray(4)
 MCP23SXX_CODE_READ = 0x41
 MCP23SXX_CODE_WRITE = 0x40
 
+# Clock rates tried by calibrate_baudrate(), the chips run at up to 10 MHz.
+_BAUDRATES = (100000, 250000, 500000, 1000000, 2000000, 4000000, 5000000, 8000000, 10000000)
+# Register indices (see mcp23xxx) of the scratch register used for
+# calibration and of the registers deciding whether it is in use.
+_GPINTEN = const(2)
+_DEFVAL = const(3)
+_INTCON = const(4)
+# Bit patterns written and read back at each calibration step.
+_PATTERNS = (0x55, 0xAA, 0x00, 0xFF, 0x0F, 0xF0, 0x33, 0xCC)
+
 
 class MCP23SXX(MCP23XXX):
     """Base class for MCP23Sxx devices."""
 
+    _out_buffer = _OUT_BUFFER
+    _in_buffer = _IN_BUFFER
+    # IOCON.DISSLW, the slew rate control of SDA the SPI chips don't have.
+    _IOCON_SENTINEL = 0x10
+
     def __init__(
         self,
         spi: SPI,
@@ -52,34 +72,149 @@ class MCP23SXX(MCP23XXX):
     def _read_u16le(self, register: int) -> int:
         # Read an unsigned 16 bit little endian value from the specified 8-bit
         # register.
-        _OUT_BUFFER[0] = self.cmd_read
-        _OUT_BUFFER[1] = register & 0xFF
+        out_buffer = self._out_buffer
+        in_buffer = self._in_buffer
+        out_buffer[0] = self.cmd_read
+        out_buffer[1] = register & 0xFF
         with self._device as bus_device:
-            bus_device.write_readinto(_OUT_BUFFER, _IN_BUFFER)
-        return (_IN_BUFFER[3] << 8) | _IN_BUFFER[2]
+            bus_device.write_readinto(out_buffer, in_buffer)
+        return (in_buffer[3] << 8) | in_buffer[2]
 
     def _write_u16le(self, register: int, value: int) -> None:
         # Write an unsigned 16 bit little endian value to the specified 8-bit
         # register.
-        _OUT_BUFFER[0] = self.cmd_write
-        _OUT_BUFFER[1] = register & 0xFF
-        _OUT_BUFFER[2] = value & 0xFF
-        _OUT_BUFFER[3] = (value >> 8) & 0xFF
+        out_buffer = self._out_buffer
+        out_buffer[0] = self.cmd_write
+        out_buffer[1] = register & 0xFF
+        out_buffer[2] = value & 0xFF
+        out_buffer[3] = (value >> 8) & 0xFF
         with self._device as bus_device:
-            bus_device.write(_OUT_BUFFER)
+            bus_device.write(out_buffer)
 
     def _read_u8(self, register: int) -> int:
         # Read an unsigned 8 bit value from the specified 8-bit register.
-        _OUT_BUFFER[0] = self.cmd_read
-        _OUT_BUFFER[1] = register & 0xFF
+        out_buffer = self._out_buffer
+        in_buffer = self._in_buffer
+        out_buffer[0] = self.cmd_read
+        out_buffer[1] = register & 0xFF
         with self._device as bus_device:
-            bus_device.write_readinto(_OUT_BUFFER, _IN_BUFFER)
-        return _IN_BUFFER[2]
+            bus_device.write_readinto(out_buffer, in_buffer)
+        return in_buffer[2]
 
     def _write_u8(self, register: int, value: int) -> None:
         # Write an 8 bit value to the specified 8-bit register.
-        _OUT_BUFFER[0] = self.cmd_write
-        _OUT_BUFFER[1] = register & 0xFF
-        _OUT_BUFFER[2] = value & 0xFF
+        out_buffer = self._out_buffer
+        out_buffer[0] = self.cmd_write
+        out_buffer[1] = register & 0xFF
+        out_buffer[2] = value & 0xFF
+        with self._device as bus_device:
+            bus_device.write(out_buffer, end=3)
+
+    def _readinto(self, register: int, buf: WriteableBuffer) -> None:
+        # Read consecutive registers, starting at the specified 8-bit
+        # register, into buf.  Chip select stays asserted for the whole
+        # context, so the header and the data make up a single command.
+        out_buffer = self._out_buffer
+        out_buffer[0] = self.cmd_read
+        out_buffer[1] = register & 0xFF
+        with self._device as bus_device:
+            bus_device.write(out_buffer, end=2)
+            bus_device.readinto(buf)
+
+    def _write_from(self, register: int, buf: ReadableBuffer) -> None:
+        # Write buf to consecutive registers, starting at the specified 8-bit
+        # register, as a single command.
+        out_buffer = self._out_buffer
+        out_buffer[0] = self.cmd_write
+        out_buffer[1] = register & 0xFF
         with self._device as bus_device:
-            bus_device.write(_OUT_BUFFER, end=3)
+            bus_device.write(out_buffer, end=2)
+            bus_device.write(buf)
+
+    def _write_u8_read_u8(self, register: int, value: int) -> int:
+        # Write an 8 bit value to the specified 8-bit register and read the
+        # following register back.  SPI commands can't switch from writing to
+        # reading within one chip select frame, so this takes two transfers.
+        self._write_u8(register, value)
+        return self._read_u8(register + 1)
+
+    @property
+    def baudrate(self) -> int:
+        """The SPI clock rate used to talk to the chip, in Hz."""
+        return self._bus_device.baudrate
+
+    @baudrate.setter
+    def baudrate(self, val: int) -> None:
+        self._bus_device.baudrate = val
+
+    def _verify_patterns(self, register: int, free: bytearray, original: bytearray) -> bool:
+        # Write each pattern to the free bits of the scratch registers and
+        # check it reads back intact, both as a burst and byte by byte.
+        ports = len(free)
+        expected = bytearray(ports)
+        readback = bytearray(ports)
+        for pattern in _PATTERNS:
+            for port in range(ports):
+                # Vary the pattern per port to catch shifted bytes.
+                value = pattern ^ (0xFF * (port & 1))
+                expected[port] = (value & free[port]) | (original[port] & ~free[port])
+            self._write_from(register, expected)
+            self._readinto(register, readback)
+            if readback != expected:
+                return False
+            for port in range(ports):
+                if self._read_u8(register + port) != expected[port]:
+                    return False
+        return True
+
+    def calibrate_baudrate(
+        self,
+        max_baudrate: int = 10000000,
+        margin: int = 1,
+        repeat: int = 4,
+        baudrates: Sequence[int] = _BAUDRATES,
+    ) -> int:
+        """Find the fastest SPI clock rate the wiring to this chip handles
+        reliably, and switch to it.  The clock is stepped up through
+        ``baudrates`` (up to ``max_baudrate``); at each step bit patterns are
+        written to DEFVAL and read back ``repeat`` times.  Calibration stops
+        at the first step that fails, then backs off ``margin`` steps from the
+        fastest step that passed.  Returns the chosen rate.
+
+        Only DEFVAL bits that aren't used for interrupt comparison are
+        touched, and DEFVAL is restored afterwards.  A failing step may
+        corrupt other registers as well though, so calibrate before setting
+        up the chip, or set it up again afterwards.  The known register state
+        (see `invalidate_cache`) is forgotten when a step fails, so the
+        writes setting the chip up again aren't skipped.
+        """
+        ports = self._ports
+        register = _DEFVAL * ports
+        original_baudrate = self.baudrate
+        steps = [rate for rate in sorted(baudrates) if rate <= max_baudrate]
+        if not steps:
+            raise ValueError("No baudrate to try at or below max_baudrate.")
+        self.baudrate = steps[0]
+        original = bytearray(ports)
+        self._readinto(register, original)
+        enabled = bytearray(ports)
+        self._readinto(_GPINTEN * ports, enabled)
+        compare = bytearray(ports)
+        self._readinto(_INTCON * ports, compare)
+        free = bytearray(~(enabled[port] & compare[port]) & 0xFF for port in range(ports))
+        passed = -1
+        for step, rate in enumerate(steps):
+            self.baudrate = rate
+            if not all(self._verify_patterns(register, free, original) for _ in range(repeat)):
+                # Any register may have been corrupted, including when the
+                # very first step fails.
+                self.invalidate_cache()
+                break
+            passed = step
+        if passed < 0:
+            self.baudrate = original_baudrate
+            self._write_from(register, original)
+            raise RuntimeError(f"Register readback failed at {steps[0]} Hz.")
+        self.baudrate = steps[max(0, passed - margin)]
+        self._write_from(register, original)
+        return self.baudrate
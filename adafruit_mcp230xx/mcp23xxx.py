@@ -11,23 +11,147 @@ CircuitPython module for the MCP23017, MCP23008 I2C and MCP23S17, MCP23S08 SPI I
 * Author(s): Red_M
 """
 
+import time
+
+import digitalio
 from adafruit_bus_device import i2c_device, spi_device
+from micropython import const
 
 try:
-    from typing import Optional, Union
+    from typing import Any, Callable, Dict, Optional, Tuple, Union
 
-    import digitalio
     from busio import I2C, SPI
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
 except ImportError:
     pass
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
 
+# Register indices of the layout shared by the MCP23008/MCP23S08 and, with
+# IOCON.BANK = 0, the MCP23017/MCP23S17.  Register n of port p lives at
+# address n * _ports + p.
+_IODIR = const(0)
+_IPOL = const(1)
+_GPINTEN = const(2)
+_DEFVAL = const(3)
+_INTCON = const(4)
+_IOCON = const(5)
+_GPPU = const(6)
+_INTF = const(7)
+_GPIO = const(9)
+_OLAT = const(10)
+
+# Registers IODIR to GPPU form one block that can be read and written in a
+# single burst.
+_CONFIG_REGISTERS = const(7)
+# Unchanged registers between two changed ones are rewritten rather than
+# starting a new burst when there are at most this many of them, as every burst
+# is a bus transaction of its own.  This keeps GPINTEN to INTCON in one burst.
+_BURST_GAP = const(4)
+
+# configure() keys and the registers they set.
+_PIN_SETTINGS = {
+    "direction": _IODIR,
+    "invert_polarity": _IPOL,
+    "interrupt_enable": _GPINTEN,
+    "default_value": _DEFVAL,
+    "interrupt_configuration": _INTCON,
+    "pull": _GPPU,
+}
+
+
+def _retrying(mcp: "MCP23XXX", method: Callable) -> Callable:
+    # Wrap a transport method to retry a transaction that raised OSError up
+    # to mcp.retries times, doubling the delay each time, then call the hook
+    # for transactions that needed a retry (see adafruit_mcp230xx.recovery).
+    def _retry(*args):
+        delay = mcp.retry_delay
+        attempt = 0
+        while True:
+            try:
+                result = method(*args)
+                break
+            except OSError:
+                if attempt >= mcp._retries:
+                    raise
+            attempt += 1
+            if mcp._metrics is not None:
+                mcp._metrics.record_retry()
+            time.sleep(delay)
+            delay *= 2
+        if attempt and mcp._after_retry is not None:
+            mcp._after_retry(mcp)
+        return result
+
+    return _retry
+
+
+def _tracking(mcp: "MCP23XXX", name: str, method: Callable) -> Callable:
+    # Wrap a transport method to keep the register image up to date, and to
+    # skip the writes it shows to be redundant.
+    if name == "_write_from":
+
+        def _track_block(register, buf):
+            method(register, buf)
+            mcp._record_block(register, buf)
+
+        return _track_block
+    if name == "_write_u8_read_u8":
+
+        def _track_exchange(register, val):
+            result = method(register, val)
+            mcp._record_write(register, val, 1)
+            return result
+
+        return _track_exchange
+    count = {"_write_u8": 1, "_write_u16le": 2}.get(name)
+    if count is None:
+        return method
+
+    def _track_write(register, val):
+        if mcp._is_redundant_write(register, val, count):
+            return
+        method(register, val)
+        mcp._record_write(register, val, count)
+
+    return _track_write
+
 
 class MCP23XXX:
     """Base class for MCP23xxx devices."""
 
+    # Number of 8 bit ports of chips using the shared register layout, None
+    # for chips with a layout of their own.
+    _ports = None
+
+    # The transport methods, wrapped per instance by _bind_transport() while
+    # retries or register tracking are enabled.
+    _TRANSPORT = (
+        "_read_u16le",
+        "_write_u16le",
+        "_read_u8",
+        "_write_u8",
+        "_readinto",
+        "_write_from",
+    )
+
+    # IOCON bit without effect on this transport, set to detect resets.
+    _IOCON_SENTINEL = 0
+
+    # The `adafruit_mcp230xx.metrics.ExpanderMetrics` of this instance, set
+    # when it is attached to a registry.
+    _metrics = None
+
+    # Stand-in for the bus device while an `adafruit_mcp230xx.session`
+    # holds the bus.
+    _held = None
+
+    # Called with this instance after a transaction that needed a retry,
+    # set by `adafruit_mcp230xx.recovery.arm_reset_detection`.
+    _after_retry = None
+    _reset_detection = False
+
     def __init__(
         self,
         bus_device: Union[I2C, SPI],
@@ -36,6 +160,317 @@ class MCP23XXX:
         baudrate: int = 100000,
     ) -> None:
         if chip_select is None:
-            self._device = i2c_device.I2CDevice(bus_device, address)
+            self._bus_device = i2c_device.I2CDevice(bus_device, address)
+        else:
+            self._bus_device = spi_device.SPIDevice(bus_device, chip_select, baudrate=baudrate)
+        # What the transport methods talk to, see _bind_device().
+        self._device = self._bus_device
+        # Last value written to each register address, and a bit mask of the
+        # addresses whose value is known.  Only kept while _tracking is set.
+        self._shadow = bytearray(0x20)
+        self._shadow_valid = 0
+        self._tracking = False
+        # Handlers registered with DigitalInOut.irq(), by pin number.
+        self._irq_handlers = {}
+        # Pin levels seen by the last interrupt service, None before the first.
+        self._irq_levels = None
+        self._retries = 0
+        self.retry_delay = 0.001
+        """The delay, in seconds, before the first retry.  It doubles with
+        every further retry."""
+        self._skip_redundant_writes = False
+
+    @property
+    def retries(self) -> int:
+        """How many times a transaction that fails with `OSError`, e.g. on a
+        NACK, is retried before the error is raised.  0, the default,
+        disables retries.
+        """
+        return self._retries
+
+    @retries.setter
+    def retries(self, val: int) -> None:
+        self._retries = val
+        self._bind_transport()
+
+    @property
+    def skip_redundant_writes(self) -> bool:
+        """When ``True``, register writes are skipped if the register is known
+        to already hold the value, e.g. when a control loop re-asserts the same
+        `gpio`, `iodir` or `gppu` every cycle.  The known state is what this
+        instance wrote or read since, so call `invalidate_cache` if the chip
+        may have been reset or written by someone else.
+        """
+        return self._skip_redundant_writes
+
+    @skip_redundant_writes.setter
+    def skip_redundant_writes(self, val: bool) -> None:
+        self._skip_redundant_writes = val
+        if val:
+            self._track_registers()
+
+    def _bind_device(self) -> None:
+        # Point _device at the bus device, or the stand-in of the session
+        # holding the bus, behind the metrics stand-in if metrics are kept.
+        device = self._held
+        if device is None:
+            device = self._bus_device
+        if self._metrics is not None:
+            device = self._metrics.wrap(device)
+        self._device = device
+
+    def _bind_transport(self) -> None:
+        # Use the plain transport methods of the class, or wrappers of them
+        # for the features that are enabled.
+        for name in self._TRANSPORT:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+            if not (self._tracking or self._retries):
+                continue
+            method = getattr(self, name)
+            if self._tracking:
+                method = _tracking(self, name, method)
+            if self._retries:
+                method = _retrying(self, method)
+            setattr(self, name, method)
+
+    def _track_registers(self) -> None:
+        # Start keeping the register image, for the features relying on it.
+        if not self._tracking:
+            self._tracking = True
+            self._bind_transport()
+
+    def invalidate_cache(self) -> None:
+        """Forget the known register state used by `skip_redundant_writes`,
+        so the next write to every register goes to the bus.  Call this after
+        the chip may have been reset or changed behind this instance's back.
+        """
+        self._shadow_valid = 0
+
+    def readinto(self, start_register: int, buf: WriteableBuffer) -> None:
+        """Read ``len(buf)`` consecutive registers, starting at
+        ``start_register``, into ``buf`` (a `bytearray` or writable
+        `memoryview`) in a single transaction.  The data goes straight from
+        the bus into ``buf``, without intermediate copies or integer
+        assembly, so a `memoryview` slice of a larger buffer can be filled in
+        place.  Relies on sequential operation (IOCON.SEQOP = 0, the
+        default); the MCP23016 only reads register pairs.
+        """
+        self._readinto(start_register, buf)
+
+    def write_from(self, start_register: int, buf: ReadableBuffer) -> None:
+        """Write ``buf`` to consecutive registers, starting at
+        ``start_register``, in a single transaction.  On SPI the data goes
+        straight from ``buf`` to the bus; on I2C the register address has to
+        lead the data in one write, which costs one copy of ``buf``.
+        """
+        self._write_from(start_register, buf)
+
+    def _shadow_address(self, register: int) -> int:
+        # Writes to GPIO land in OLAT, track them there.
+        ports = self._ports
+        if ports and _GPIO * ports <= register < _OLAT * ports:
+            return register + ports
+        return register
+
+    def _is_redundant_write(self, register: int, val: int, count: int) -> bool:
+        # Whether writing count bytes of val (little endian) at register can
+        # be skipped because the registers are known to hold them already.
+        if not self._skip_redundant_writes:
+            return False
+        register = self._shadow_address(register)
+        mask = ((1 << count) - 1) << register
+        if self._shadow_valid & mask != mask:
+            return False
+        for i in range(count):
+            if self._shadow[register + i] != (val >> (8 * i)) & 0xFF:
+                return False
+        return True
+
+    def _record_write(self, register: int, val: int, count: int) -> None:
+        # Remember the bytes just written at register.
+        register = self._shadow_address(register)
+        for i in range(count):
+            self._shadow[register + i] = (val >> (8 * i)) & 0xFF
+        self._shadow_valid |= ((1 << count) - 1) << register
+        iocon = _IOCON * 2
+        if self._ports == 2 and register < iocon + 2 and register + count > iocon:
+            # The MCP23x17 has one IOCON at two addresses, the last one written
+            # wins.  Keep both copies in step, so a burst never writes back a
+            # stale one.
+            value = self._shadow[min(register + count, iocon + 2) - 1]
+            self._shadow[iocon] = value
+            self._shadow[iocon + 1] = value
+            self._shadow_valid |= 3 << iocon
+
+    def _record_block(self, register: int, buf: ReadableBuffer) -> None:
+        # Remember a block of bytes just written starting at register.  The
+        # address pointer rolls over from OLAT to the first register.
+        size = (_OLAT + 1) * self._ports if self._ports else len(self._shadow)
+        for i, val in enumerate(buf):
+            self._record_write((register + i) % size, val, 1)
+
+    def _write_bit(self, register: int, pin: int, val: bool) -> None:
+        # Set the bit of a pin in a per-port register (given by index) with a
+        # single one byte write, based on the known register image, which is
+        # read first if it isn't known.  Nothing is written if the bit already
+        # has the value.
+        self._track_registers()
+        address = register * self._ports + pin // 8
+        if self._shadow_valid >> address & 1:
+            current = self._shadow[address]
         else:
-            self._device = spi_device.SPIDevice(bus_device, chip_select, baudrate=baudrate)
+            current = self._read_u8(address)
+            self._record_write(address, current, 1)
+        bit = 1 << (pin % 8)
+        new = current | bit if val else current & ~bit
+        if new != current:
+            self._write_u8(address, new)
+
+    def _set_open_drain(self, pin: int, value: bool) -> None:
+        # Open-drain emulation: the pin's OLAT bit stays low and the level is
+        # set by IODIR alone, released (input) for high, driven low (output)
+        # for low.  Once OLAT is known low, a level change is one write.  For
+        # high the pin is released before OLAT is cleared, so a push-pull
+        # output that was high is never driven low on the way.
+        if value:
+            self._write_bit(_IODIR, pin, True)
+            self._write_bit(_OLAT, pin, False)
+        else:
+            self._write_bit(_OLAT, pin, False)
+            self._write_bit(_IODIR, pin, False)
+
+    def _read_block(self, register: int, count: int) -> bytearray:
+        # Read count consecutive registers, from the shadow when writes are
+        # trusted to be tracked and every byte is known.
+        mask = ((1 << count) - 1) << register
+        if self._skip_redundant_writes and self._shadow_valid & mask == mask:
+            return self._shadow[register : register + count]
+        buf = bytearray(count)
+        self._readinto(register, buf)
+        if self._tracking:
+            # Configuration and latch registers keep what was read.
+            self._record_block(register, buf)
+        return buf
+
+    def _write_changes(self, register: int, old: ReadableBuffer, new: ReadableBuffer) -> None:
+        # Write the bytes of new that differ from old, starting at register,
+        # in as few bursts as is worth it.
+        new = memoryview(new)
+        start = None
+        end = 0
+        for i, val in enumerate(new):
+            if val == old[i]:
+                continue
+            if start is not None and i - end > _BURST_GAP:
+                self._write_from(register + start, new[start:end])
+                start = None
+            if start is None:
+                start = i
+            end = i + 1
+        if start is not None:
+            self._write_from(register + start, new[start:end])
+
+    def configure(self, pins: Dict[int, Dict[str, Any]]) -> None:
+        """Configure many pins at once.  ``pins`` maps pin numbers to a
+        dictionary of settings, any of:
+
+        * ``direction``: `digitalio.Direction.INPUT` or ``OUTPUT``
+        * ``value``: the output value, ``True`` or ``False``
+        * ``pull``: `digitalio.Pull.UP` or ``None``
+        * ``invert_polarity``: ``True`` or ``False``
+        * ``interrupt_enable``: whether the pin interrupts, ``True`` or ``False``
+        * ``interrupt_configuration``: ``True`` to compare against
+          ``default_value``, ``False`` to interrupt on any change
+        * ``default_value``: the interrupt comparison value, ``True`` or ``False``
+
+        For example:
+
+        .. code-block:: python
+
+            mcp.configure({
+                0: {"direction": digitalio.Direction.OUTPUT, "value": True},
+                8: {"direction": digitalio.Direction.INPUT, "pull": digitalio.Pull.UP},
+            })
+
+        The final IODIR, IPOL, GPINTEN, DEFVAL, INTCON and GPPU images are
+        computed from a single read of the configuration registers and only
+        the registers that change are written, in as few sequential bursts as
+        possible.  Output values are latched before any pin turns into an
+        output.  Settings of pins that are not mentioned are left untouched.
+        """
+        ports = self._ports
+        if not ports:
+            raise ValueError("Bulk configuration is not supported.")
+        size = _CONFIG_REGISTERS * ports
+        old = self._read_block(0, size)
+        new = bytearray(old)
+        olat_set = 0
+        olat_clear = 0
+        for pin, settings in pins.items():
+            if not 0 <= pin < 8 * ports:
+                raise ValueError(f"Pin number must be 0-{8 * ports - 1}.")
+            port = pin // 8
+            bit = 1 << (pin % 8)
+            for name, setting in settings.items():
+                if name == "value":
+                    if setting:
+                        olat_set |= 1 << pin
+                    else:
+                        olat_clear |= 1 << pin
+                    continue
+                if name == "direction":
+                    if setting not in {digitalio.Direction.INPUT, digitalio.Direction.OUTPUT}:
+                        raise ValueError("Expected INPUT or OUTPUT direction!")
+                    enable = setting == digitalio.Direction.INPUT
+                elif name == "pull":
+                    if setting == digitalio.Pull.DOWN:
+                        raise ValueError("Pull-down resistors are not supported!")
+                    if setting not in {None, digitalio.Pull.UP}:
+                        raise ValueError("Expected UP, DOWN, or None for pull state!")
+                    enable = setting == digitalio.Pull.UP
+                elif name in _PIN_SETTINGS:
+                    enable = setting
+                else:
+                    raise ValueError(f"Unknown pin setting {name!r}.")
+                address = _PIN_SETTINGS[name] * ports + port
+                if enable:
+                    new[address] |= bit
+                else:
+                    new[address] &= ~bit
+        if olat_set or olat_clear:
+            olat = self._read_block(_OLAT * ports, ports)
+            latch = bytearray(olat)
+            for port in range(ports):
+                latch[port] |= (olat_set >> (8 * port)) & 0xFF
+                latch[port] &= ~(olat_clear >> (8 * port)) & 0xFF
+            self._write_changes(_OLAT * ports, olat, latch)
+        self._write_changes(0, old, new)
+
+    @property
+    def int_state(self) -> Tuple[int, int, int]:
+        """Returns a tuple of the raw INTF, INTCAP and GPIO registers, all read
+        in a single transaction.  On the 16 pin expanders each value is 16 bits
+        wide with port A in the low byte.  Reading INTCAP and GPIO clears the
+        interrupt.
+        """
+        ports = self._ports
+        if not ports:
+            raise ValueError("Interrupt servicing is not supported.")
+        buf = bytearray(3 * ports)
+        self._readinto(_INTF * ports, buf)
+        if ports == 1:
+            return buf[0], buf[1], buf[2]
+        return buf[0] | (buf[1] << 8), buf[2] | (buf[3] << 8), buf[4] | (buf[5] << 8)
+
+
+def _give_own_buffers(chip: MCP23XXX) -> None:
+    # The transport buffers are shared by all instances by default, which
+    # isn't safe once chips are accessed from several threads.
+    if hasattr(chip, "_buffer"):
+        chip._buffer = bytearray(3)
+    if hasattr(chip, "_out_buffer"):
+        chip._out_buffer = bytearray(4)
+        chip._in_buffer = bytearray(4)
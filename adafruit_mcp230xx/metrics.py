@@ -0,0 +1,261 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`metrics`
+====================================================
+
+Operational metrics of expanders and their buses, for monitoring.
+
+Expanders attached to a `MetricsRegistry` count their transactions, errors
+(and among them NACKs), retries, and record the latency of the latest
+transactions and interrupt services.  The registry exports all of them in the
+Prometheus text format or as JSON:
+
+.. code-block:: python
+
+    registry = MetricsRegistry()
+    registry.attach(mcp, "panel")
+    ...
+    print(registry.prometheus())
+
+Transactions per second and the latency quantiles are computed over the
+latest ``window`` observations of each expander.  Interrupt service latency
+is the duration of `adafruit_mcp230xx.interrupts.process_interrupts`, or, with an
+`InterruptGuard`, the time from its notification to the end of the dispatch.
+
+* Author(s): Adafruit Industries
+"""
+
+import json
+import time
+from array import array
+
+try:
+    from typing import Any, Dict, Optional
+
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+# OSError numbers of a device not acknowledging: ENODEV (CircuitPython) and
+# EREMOTEIO (Linux).
+_NACK_ERRNOS = (19, 121)
+
+_QUANTILES = (0.5, 0.99)
+
+
+class _Window:
+    """The latest observations of a value, for quantiles and rates."""
+
+    def __init__(self, size: int) -> None:
+        self._values = array("d", [0.0] * size)
+        self._times = array("d", [0.0] * size)
+        self._next = 0
+        self.count = 0
+        """The number of observations ever made."""
+        self.sum = 0.0
+        """The sum of all observations ever made."""
+
+    def add(self, value: float) -> None:
+        index = self._next
+        self._values[index] = value
+        self._times[index] = time.monotonic()
+        self._next = (index + 1) % len(self._values)
+        self.count += 1
+        self.sum += value
+
+    def _size(self) -> int:
+        return min(self.count, len(self._values))
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        size = self._size()
+        if not size:
+            return None
+        values = sorted(self._values[:size])
+        # Nearest rank.
+        return values[max(0, min(size - 1, int(quantile * size + 0.5) - 1))]
+
+    def rate(self) -> float:
+        size = self._size()
+        if not size:
+            return 0.0
+        oldest = self._times[self._next if self.count > size else 0]
+        span = time.monotonic() - oldest
+        return size / span if span > 0 else 0.0
+
+
+class _MeteredDevice:
+    """Stands in for a bus device and records the transactions made with
+    it.
+    """
+
+    def __init__(self, device: Any, metrics: "ExpanderMetrics") -> None:
+        self._device = device
+        self._metrics = metrics
+        self._start = 0
+
+    def __enter__(self) -> Any:
+        self._start = time.monotonic_ns()
+        return self._device.__enter__()
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self._device.__exit__(exception_type, exception_value, traceback)
+        self._metrics._record((time.monotonic_ns() - self._start) / 1e9, exception_value)
+
+
+class ExpanderMetrics:
+    """The metrics of one expander, see `MetricsRegistry.attach`.
+
+    :param str name: The name of the expander in the exported metrics.
+    :param int window: The number of latest observations quantiles and rates
+        are computed over.
+    """
+
+    def __init__(self, name: str, window: int = 1024) -> None:
+        self.name = name
+        self.transactions = 0
+        """The number of bus transactions."""
+        self.errors = 0
+        """The number of transactions that raised an exception."""
+        self.nacks = 0
+        """The number of errors that were NACKs."""
+        self.retries = 0
+        """The number of transactions retried."""
+        self._latency = _Window(window)
+        self._interrupt_latency = _Window(window)
+
+    @property
+    def transactions_per_second(self) -> float:
+        """The transaction rate over the latest transactions."""
+        return self._latency.rate()
+
+    def wrap(self, device: Any) -> _MeteredDevice:
+        """Returns a stand-in for a bus device that records the transactions
+        made with it.
+        """
+        return _MeteredDevice(device, self)
+
+    def _record(self, latency: float, error: Optional[BaseException]) -> None:
+        self.transactions += 1
+        self._latency.add(latency)
+        if error is not None:
+            self.errors += 1
+            if isinstance(error, OSError) and error.errno in _NACK_ERRNOS:
+                self.nacks += 1
+
+    def record_retry(self) -> None:
+        """Count a retried transaction."""
+        self.retries += 1
+
+    def record_interrupt(self, latency: float) -> None:
+        """Record the latency of an interrupt service, in seconds."""
+        self._interrupt_latency.add(latency)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The metrics as a dictionary, latencies in seconds and ``None`` if
+        nothing was observed yet.
+        """
+        latency = self._latency
+        interrupt_latency = self._interrupt_latency
+        return {
+            "transactions": self.transactions,
+            "transactions_per_second": self.transactions_per_second,
+            "errors": self.errors,
+            "nacks": self.nacks,
+            "retries": self.retries,
+            "latency_p50": latency.quantile(0.5),
+            "latency_p99": latency.quantile(0.99),
+            "interrupts": interrupt_latency.count,
+            "interrupt_latency_p50": interrupt_latency.quantile(0.5),
+            "interrupt_latency_p99": interrupt_latency.quantile(0.99),
+        }
+
+
+def _sample(name: str, labels: str, value: Optional[float]) -> str:
+    if value is None:
+        value = "NaN"
+    return f"{name}{{{labels}}} {value}"
+
+
+class MetricsRegistry:
+    """Collects the metrics of several expanders and exports them."""
+
+    def __init__(self) -> None:
+        self._expanders = {}
+
+    def attach(
+        self, mcp: MCP23XXX, name: Optional[str] = None, window: int = 1024
+    ) -> ExpanderMetrics:
+        """Start recording the metrics of ``mcp`` under ``name`` (its number
+        in the registry by default).  Returns its `ExpanderMetrics`.
+        """
+        if name is None:
+            name = str(len(self._expanders))
+        if name in self._expanders:
+            raise ValueError(f"An expander named {name!r} is already attached.")
+        metrics = ExpanderMetrics(name, window)
+        mcp._metrics = metrics
+        mcp._bind_device()
+        self._expanders[name] = (mcp, metrics)
+        return metrics
+
+    def detach(self, mcp: MCP23XXX) -> None:
+        """Stop recording the metrics of ``mcp`` and drop them."""
+        for name, (attached, _) in list(self._expanders.items()):
+            if attached is mcp:
+                del self._expanders[name]
+                mcp._metrics = None
+                mcp._bind_device()
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """The metrics of all expanders, by name."""
+        return {name: metrics.as_dict() for name, (_, metrics) in self._expanders.items()}
+
+    def to_json(self) -> str:
+        """The metrics of all expanders as JSON."""
+        return json.dumps(self.as_dict())
+
+    def prometheus(self) -> str:
+        """The metrics of all expanders in the Prometheus text format."""
+        families = (
+            ("transactions_total", "counter", "Bus transactions.", "transactions"),
+            ("errors_total", "counter", "Bus transactions that failed.", "errors"),
+            ("nacks_total", "counter", "Bus transactions not acknowledged.", "nacks"),
+            ("retries_total", "counter", "Bus transactions retried.", "retries"),
+            (
+                "transactions_per_second",
+                "gauge",
+                "Recent bus transaction rate.",
+                "transactions_per_second",
+            ),
+        )
+        lines = []
+        expanders = [metrics for _, metrics in self._expanders.values()]
+        for suffix, kind, help_text, key in families:
+            name = "mcp230xx_" + suffix
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for metrics in expanders:
+                lines.append(_sample(name, f'expander="{metrics.name}"', getattr(metrics, key)))
+        for suffix, help_text, attribute in (
+            ("transaction_latency_seconds", "Bus transaction latency.", "_latency"),
+            ("interrupt_latency_seconds", "Interrupt service latency.", "_interrupt_latency"),
+        ):
+            name = "mcp230xx_" + suffix
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} summary")
+            for metrics in expanders:
+                window = getattr(metrics, attribute)
+                labels = f'expander="{metrics.name}"'
+                for quantile in _QUANTILES:
+                    lines.append(
+                        _sample(name, f'{labels},quantile="{quantile}"', window.quantile(quantile))
+                    )
+                lines.append(_sample(name + "_sum", labels, window.sum))
+                lines.append(_sample(name + "_count", labels, window.count))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`pin_map`
+====================================================
+
+Logical pin names for boards that route the expander pins to connectors in
+their own order.
+
+A `PinMap` assigns each logical pin, a name or a connector number, to a pin
+of the chip.  Logical pin ``n`` in the order of the wiring is bit ``n`` of
+the values `PinMap.read` returns and `PinMap.write` takes.  Whole-port
+values are translated with 256-entry tables built up front, one lookup per
+8 bit port in each direction, rather than a loop over the bits on every
+access.
+
+.. code-block:: python
+
+    # Connector pins 1-8 are wired to GPB7..GPB0, i.e. in reverse.
+    header = PinMap(mcp, {n + 1: 15 - n for n in range(8)})
+    header.get_pin(3).switch_to_output()
+    header.write(0b00000101)
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+try:
+    from typing import Dict, Optional, Sequence, Union
+
+    from adafruit_mcp230xx.digital_inout import DigitalInOut
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+
+def _remap_tables(positions: Sequence[int], groups: int) -> list:
+    # One table per 8 bit group of source bits: table[g][byte] is the target
+    # bit mask of the source bits 8 * g to 8 * g + 7 being byte.
+    tables = []
+    for group in range(groups):
+        table = array("H", [0] * 256)
+        for bit in range(8):
+            source = 8 * group + bit
+            if source < len(positions) and positions[source] is not None:
+                target = 1 << positions[source]
+                step = 1 << bit
+                # Set the target bit in every entry with the source bit set.
+                for byte in range(256):
+                    if byte & step:
+                        table[byte] |= target
+        tables.append(table)
+    return tables
+
+
+class PinMap:
+    """Logical pin names over the pins of one expander.
+
+    :param MCP23XXX mcp: The expander.
+    :param wiring: The chip pin of each logical pin, either as a sequence, the
+        logical pins being its indices (e.g. connector numbers from 0), or as
+        a dictionary of logical names or numbers to chip pins.  Its order sets
+        the logical bit order.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP23XXX,
+        wiring: Union[Sequence[int], Dict[Union[str, int], int]],
+    ) -> None:
+        self._mcp = mcp
+        ports = mcp._ports or 2
+        width = 8 * ports
+        if not isinstance(wiring, dict):
+            wiring = dict(enumerate(wiring))
+        if len(wiring) > width:
+            raise ValueError(f"At most {width} pins can be mapped.")
+        self._pins = {}
+        self._bits = {}
+        to_physical = []
+        to_logical = [None] * width
+        mask = 0
+        for bit, (name, pin) in enumerate(wiring.items()):
+            if not 0 <= pin < width:
+                raise ValueError(f"Pin number must be 0-{width - 1}.")
+            if to_logical[pin] is not None:
+                raise ValueError(f"Pin {pin} is mapped twice.")
+            self._pins[name] = pin
+            self._bits[name] = bit
+            to_physical.append(pin)
+            to_logical[pin] = bit
+            mask |= 1 << pin
+        self._mask = mask
+        self._full = mask == (1 << width) - 1
+        self._to_physical = _remap_tables(to_physical, (len(to_physical) + 7) // 8)
+        self._to_logical = _remap_tables(to_logical, ports)
+
+    def __len__(self) -> int:
+        return len(self._pins)
+
+    @property
+    def names(self) -> Sequence[Union[str, int]]:
+        """The logical pins, in logical bit order."""
+        return tuple(self._pins)
+
+    def pin(self, name: Union[str, int]) -> int:
+        """Returns the chip pin number of a logical pin."""
+        try:
+            return self._pins[name]
+        except KeyError:
+            raise ValueError(f"Unknown pin {name!r}.") from None
+
+    def bit(self, name: Union[str, int]) -> int:
+        """Returns the bit of a logical pin in `read` and `write` values."""
+        self.pin(name)
+        return self._bits[name]
+
+    def get_pin(self, name: Union[str, int]) -> DigitalInOut:
+        """Convenience function to create an instance of the DigitalInOut
+        class pointing at the chip pin of a logical pin.
+        """
+        return self._mcp.get_pin(self.pin(name))
+
+    def to_logical(self, value: int) -> int:
+        """Translate a chip port value to a logical value."""
+        logical = 0
+        for table in self._to_logical:
+            logical |= table[value & 0xFF]
+            value >>= 8
+        return logical
+
+    def to_physical(self, value: int) -> int:
+        """Translate a logical value to a chip port value."""
+        physical = 0
+        for table in self._to_physical:
+            physical |= table[value & 0xFF]
+            value >>= 8
+        return physical
+
+    def read(self) -> int:
+        """Read the GPIO state of all logical pins with one register read."""
+        return self.to_logical(self._mcp.gpio)
+
+    def write(self, value: int, mask: Optional[int] = None) -> None:
+        """Write the output state of the logical pins selected by ``mask``
+        (all by default).  If not every pin of the chip is written, the
+        others are kept with a read-modify-write.
+        """
+        physical_mask = self._mask if mask is None else self.to_physical(mask)
+        physical = self.to_physical(value) & physical_mask
+        if not self._full or mask is not None:
+            physical |= self._mcp.gpio & ~physical_mask
+        self._mcp.gpio = physical
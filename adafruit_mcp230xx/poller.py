@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`poller`
+====================================================
+
+Change detection by polling, for boards where the expander's interrupt pin
+isn't wired.  Each poll is a single read of `gpio`; the changed pins are found
+by XOR against the previous sample and reported to callbacks.  The poll
+interval drops to its minimum as soon as something changes and backs off
+towards its maximum while the inputs stay idle, so an idle bus carries
+orders of magnitude less traffic while the response stays fast during
+activity.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+try:
+    from typing import Callable, Optional
+
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+
+class Poller:
+    """Polls the `gpio` register of an expander with an adaptive interval.
+
+    :param MCP23XXX mcp: The expander to poll.
+    :param float min_interval: The interval, in seconds, used right after a change.
+    :param float max_interval: The longest interval, reached after a stretch
+        without changes.
+    :param float backoff: The factor the interval grows by after each poll
+        that saw no change.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP23XXX,
+        min_interval: float = 0.001,
+        max_interval: float = 0.1,
+        backoff: float = 1.5,
+    ) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Expected 0 < min_interval <= max_interval!")
+        if backoff < 1:
+            raise ValueError("Backoff must be at least 1.")
+        self._mcp = mcp
+        self._callbacks = []
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        """The current poll interval in seconds."""
+        self.value = mcp.gpio
+        """The GPIO state seen by the last poll."""
+        self._next = time.monotonic()
+
+    def on_change(self, callback: Callable[[int, int], None], mask: Optional[int] = None) -> None:
+        """Register a ``callback(changed, value)`` that is called after a poll
+        when any of the pins selected by ``mask`` (all pins by default)
+        changed.  ``changed`` is the bit mask of the pins that changed and
+        ``value`` the new GPIO state.
+        """
+        self._callbacks.append((callback, -1 if mask is None else mask))
+
+    def poll(self) -> int:
+        """Read the GPIO state now, dispatch the callbacks and adapt the
+        interval.  Returns the bit mask of the pins that changed.
+        """
+        value = self._mcp.gpio
+        changed = value ^ self.value
+        self.value = value
+        if changed:
+            self.interval = self.min_interval
+            for callback, mask in self._callbacks:
+                if changed & mask:
+                    callback(changed, value)
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        self._next = time.monotonic() + self.interval
+        return changed
+
+    def update(self) -> int:
+        """Poll if the current interval has elapsed since the previous poll.
+        Call this regularly, e.g. from the main loop.  Returns the bit mask of
+        the pins that changed, 0 if nothing changed or no poll was due.
+        """
+        if time.monotonic() < self._next:
+            return 0
+        return self.poll()
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """Keep polling, sleeping between polls, for ``duration`` seconds or
+        forever if it is ``None``.
+        """
+        end = None if duration is None else time.monotonic() + duration
+        while end is None or time.monotonic() < end:
+            delay = self._next - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.poll()
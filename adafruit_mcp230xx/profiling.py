@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`profiling`
+====================================================
+
+Attribution of bus traffic to the API calls that cause it.
+
+While a `profile` is active, every transaction of every expander is counted
+against the outermost public method of this library on the call stack, e.g.
+``DigitalInOut.value``, ``MCP23017.int_flag`` or the constructor's reset
+(``MCP23017.__init__``):
+
+.. code-block:: python
+
+    from adafruit_mcp230xx.profiling import profile
+
+    with profile() as p:
+        run_the_application()
+    print(p.report())
+
+The bookkeeping is a stack walk and a few counter updates per transaction,
+small next to the transaction itself, so a profile can stay active through a
+long soak test.  Transactions are only intercepted while a profile is active.
+
+This module inspects stack frames and uses threads, and is meant for CPython
+(e.g. Blinka on Linux).
+
+* Author(s): Adafruit Industries
+"""
+
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+
+try:
+    from typing import Any, List, Optional
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+_PACKAGE = "adafruit_mcp230xx."
+
+ProfileEntry = namedtuple("ProfileEntry", ("name", "transactions", "bytes", "time", "lock_wait"))
+"""The traffic attributed to one method by a `Profile`: the number of
+transactions, the number of bytes transferred, the total time spent in
+them and the part of that spent acquiring the bus, in seconds."""
+
+# The profiles currently active, every transaction is reported to each.
+_active = []
+
+
+def _span_length(buf: ReadableBuffer, start: int = 0, end: Optional[int] = None) -> int:
+    return (len(buf) if end is None else end) - start
+
+
+def _caller() -> str:
+    # The outermost public method of this package on the stack, or the
+    # innermost method of the package if none of them is public.
+    name = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith(_PACKAGE):
+            function = frame.f_code.co_name
+            if name is None or not function.startswith("_") or function == "__init__":
+                owner = frame.f_locals.get("self")
+                name = function if owner is None else f"{type(owner).__name__}.{function}"
+        frame = frame.f_back
+    return name or "?"
+
+
+def _get_device(mcp: MCP23XXX) -> "_ProfiledDevice":
+    return _ProfiledDevice(vars(mcp)["_device"], _caller())
+
+
+def _set_device(mcp: MCP23XXX, device: Any) -> None:
+    vars(mcp)["_device"] = device
+
+
+# Installed as MCP23XXX._device while a profile is active, so the transport
+# methods of every expander get their bus device through it.
+_PROFILED_DEVICE = property(_get_device, _set_device)
+
+
+class _ProfiledDevice:
+    """Stands in for a bus device for one transaction, timing it and
+    counting the bytes transferred.
+    """
+
+    def __init__(self, device: Any, name: str) -> None:
+        self._device = device
+        self._name = name
+        self._bus = None
+        self._bytes = 0
+        self._start = 0
+        self._acquired = 0
+
+    def __enter__(self) -> "_ProfiledDevice":
+        self._start = time.monotonic_ns()
+        self._bus = self._device.__enter__()
+        self._acquired = time.monotonic_ns()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self._device.__exit__(exception_type, exception_value, traceback)
+        elapsed = time.monotonic_ns() - self._start
+        for profile_ in _active:
+            profile_._add(self._name, self._bytes, elapsed, self._acquired - self._start)
+
+    def write(self, buf: ReadableBuffer, **kwargs) -> None:
+        self._bytes += _span_length(buf, kwargs.get("start", 0), kwargs.get("end"))
+        self._bus.write(buf, **kwargs)
+
+    def readinto(self, buf: WriteableBuffer, **kwargs) -> None:
+        self._bytes += _span_length(buf, kwargs.get("start", 0), kwargs.get("end"))
+        self._bus.readinto(buf, **kwargs)
+
+    def _count(self, out_buffer: ReadableBuffer, in_buffer: WriteableBuffer, kwargs) -> None:
+        self._bytes += _span_length(
+            out_buffer, kwargs.get("out_start", 0), kwargs.get("out_end")
+        ) + _span_length(in_buffer, kwargs.get("in_start", 0), kwargs.get("in_end"))
+
+    def write_then_readinto(
+        self, out_buffer: ReadableBuffer, in_buffer: WriteableBuffer, **kwargs
+    ) -> None:
+        self._count(out_buffer, in_buffer, kwargs)
+        self._bus.write_then_readinto(out_buffer, in_buffer, **kwargs)
+
+    def write_readinto(
+        self, out_buffer: ReadableBuffer, in_buffer: WriteableBuffer, **kwargs
+    ) -> None:
+        self._count(out_buffer, in_buffer, kwargs)
+        self._bus.write_readinto(out_buffer, in_buffer, **kwargs)
+
+
+class Profile:
+    """Bus traffic of all expanders, per calling method, collected while the
+    profile is active.  Use it as a context manager, see `profile`.
+    Profiles can be nested; each sees every transaction made while it is
+    active.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # [transactions, bytes, nanoseconds, nanoseconds waited] by name.
+        self._stats = {}
+
+    def __enter__(self) -> "Profile":
+        if not _active:
+            MCP23XXX._device = _PROFILED_DEVICE
+        _active.append(self)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        _active.remove(self)
+        if not _active:
+            del MCP23XXX._device
+
+    def _add(self, name: str, count: int, elapsed: int, waited: int) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = [0, 0, 0, 0]
+            stats[0] += 1
+            stats[1] += count
+            stats[2] += elapsed
+            stats[3] += waited
+
+    def reset(self) -> None:
+        """Discard the traffic collected so far."""
+        with self._lock:
+            self._stats.clear()
+
+    @property
+    def entries(self) -> List[ProfileEntry]:
+        """The traffic per method, most time consuming first."""
+        with self._lock:
+            entries = [
+                ProfileEntry(name, stats[0], stats[1], stats[2] / 1e9, stats[3] / 1e9)
+                for name, stats in self._stats.items()
+            ]
+        entries.sort(key=lambda entry: entry.time, reverse=True)
+        return entries
+
+    def report(self) -> str:
+        """Returns a table of the traffic per method, most time consuming
+        first, with times in milliseconds.
+        """
+        entries = self.entries
+        width = max([len(entry.name) for entry in entries] + [len("total")])
+        lines = [f"{'method':<{width}} {'xfers':>8} {'bytes':>10} {'time ms':>10} {'wait ms':>10}"]
+        totals = [0, 0, 0.0, 0.0]
+        for entry in entries:
+            lines.append(
+                f"{entry.name:<{width}} {entry.transactions:>8} {entry.bytes:>10} "
+                f"{entry.time * 1000:>10.3f} {entry.lock_wait * 1000:>10.3f}"
+            )
+            for index, value in enumerate(entry[1:]):
+                totals[index] += value
+        lines.append(
+            f"{'total':<{width}} {totals[0]:>8} {totals[1]:>10} "
+            f"{totals[2] * 1000:>10.3f} {totals[3] * 1000:>10.3f}"
+        )
+        return "\n".join(lines)
+
+
+def profile() -> Profile:
+    """Returns a new `Profile`, to be used as a context manager:
+    ``with profile() as p:``.
+    """
+    return Profile()
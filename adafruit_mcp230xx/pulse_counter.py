@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`pulse_counter`
+====================================================
+
+Pulse counting on MCP230xx inputs, e.g. for flow meters and tally counters.
+
+The counts of all pins of one expander are kept in an ``array`` and updated
+from the interrupt state: every `PulseCounter.update` reads INTF, INTCAP and
+GPIO in a single transaction and counts the edges of every counted pin,
+including edges inferred from the levels (see
+`adafruit_mcp230xx.interrupts.interrupt_events`).  The counts are read out together with
+`PulseCounter.snapshot`, which can reset them at the same time.
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+import digitalio
+
+try:
+    from threading import Lock
+except ImportError:
+    # No threads (CircuitPython), so nothing to guard the counts against.
+    class Lock:
+        """Stands in for `threading.Lock` where there are no threads."""
+
+        def __enter__(self) -> None:
+            pass
+
+        def __exit__(self, exception_type, exception_value, traceback) -> None:
+            pass
+
+
+from adafruit_mcp230xx.digital_inout import DigitalInOut
+from adafruit_mcp230xx.interrupts import _arm_change_inputs, interrupt_events
+
+try:
+    from typing import Iterable, Optional, Sequence
+
+    from adafruit_mcp230xx.interrupts import InterruptEvent
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+
+class PulseCounter:
+    """Counts pulses on several inputs of one expander.
+
+    :param MCP23XXX mcp: The expander the inputs are on.
+    :param Sequence[int] pins: The pins to count on.  Counts are indexed in
+        this order.
+    :param int edge: The edges counted, `DigitalInOut.RISING`,
+        `DigitalInOut.FALLING` or `DigitalInOut.BOTH`.
+    :param ~digitalio.Pull pull: The pull of the inputs, ``Pull.UP`` (the
+        default) for open collector sensors or ``None``.  Ignored on the
+        MCP23016, which has no pull-ups.
+    :param digitalio.DigitalInOut interrupt: Optional host input connected to
+        the expander's (mirrored) interrupt pin.  When given, `update` skips
+        the bus read while no interrupt is pending.
+
+    The pins are configured as inputs with interrupt-on-change enabled.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP23XXX,
+        pins: Sequence[int],
+        edge: int = DigitalInOut.RISING,
+        pull: Optional[digitalio.Pull] = digitalio.Pull.UP,
+        interrupt: Optional[digitalio.DigitalInOut] = None,
+    ) -> None:
+        if edge not in {DigitalInOut.RISING, DigitalInOut.FALLING, DigitalInOut.BOTH}:
+            raise ValueError("Expected RISING, FALLING or BOTH!")
+        self._mcp = mcp
+        self._interrupt = interrupt
+        self._pins = tuple(pins)
+        # The level an edge has to end at to be counted, None for both.
+        self._level = {DigitalInOut.RISING: 1, DigitalInOut.FALLING: 0}.get(edge)
+        self._index = {pin: index for index, pin in enumerate(self._pins)}
+        self._zeros = (0,) * len(self._pins)
+        self._counts = array("L", self._zeros)
+        # Guards the counts against a concurrent snapshot swapping them.
+        self._lock = Lock()
+        _arm_change_inputs(mcp, self._pins, pull)
+
+    def __getitem__(self, index: int) -> int:
+        return self._counts[index]
+
+    def __len__(self) -> int:
+        return len(self._pins)
+
+    @property
+    def pins(self) -> Sequence[int]:
+        """The pins counted on, in the order of the counts."""
+        return self._pins
+
+    def count(self, events: Iterable[InterruptEvent]) -> int:
+        """Count the edges among ``events``, as returned by
+        `adafruit_mcp230xx.interrupts.interrupt_events`, for code that services the interrupt
+        itself and shares the events with other consumers.  Events of pins
+        that aren't counted are ignored.  Returns the number of pulses
+        counted.
+        """
+        index = self._index
+        level = self._level
+        counted = 0
+        with self._lock:
+            counts = self._counts
+            for event in events:
+                if event.pin in index and (level is None or event.value == level):
+                    counts[index[event.pin]] += 1
+                    counted += 1
+        return counted
+
+    def update(self) -> int:
+        """Service the expander's interrupt with one bus read and count the
+        edges behind it.  Returns the number of pulses counted.
+        """
+        if self._interrupt is not None and self._interrupt.value:
+            return 0
+        return self.count(interrupt_events(self._mcp))
+
+    def snapshot(self, reset: bool = True) -> array:
+        """Returns the counts of all pins as an ``array``, in the order of
+        `pins`.  With ``reset`` the counts restart from zero.  Counting and
+        the switch to new counts are serialized with a lock, so no pulse
+        counted concurrently (e.g. by `update` in another thread) is lost or
+        counted twice.
+        """
+        with self._lock:
+            if not reset:
+                return array("L", self._counts)
+            counts = self._counts
+            self._counts = array("L", self._zeros)
+        return counts
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`recovery`
+====================================================
+
+Detecting a reset of an expander, e.g. on a brownout, and writing its
+configuration back.
+
+.. code-block:: python
+
+    from adafruit_mcp230xx import recovery
+
+    mcp.retries = 3
+    recovery.arm_reset_detection(mcp)
+    ...
+    recovery.check_reset(mcp)  # Or let a retried transaction check.
+
+The configuration written back is what the expander was told since reset
+detection was armed, so arm it before setting the expander up.
+
+* Author(s): Adafruit Industries
+"""
+
+from micropython import const
+
+try:
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+# Register indices (see mcp23xxx).  IODIR to GPPU form one block.
+_IOCON = const(5)
+_OLAT = const(10)
+_CONFIG_REGISTERS = const(7)
+
+
+def _recover(mcp: MCP23XXX) -> None:
+    # Called after a transaction that needed a retry: the error may have been
+    # the chip resetting.  The check's own retries don't check again.
+    mcp._after_retry = None
+    try:
+        check_reset(mcp)
+    finally:
+        mcp._after_retry = _recover
+
+
+def arm_reset_detection(mcp: MCP23XXX) -> None:
+    """Set a sentinel bit in IOCON of ``mcp`` that a reset of the chip clears,
+    so `check_reset` can tell whether the chip lost its configuration.  The
+    bit has no effect on the chip: HAEN on the I2C chips, where the address
+    pins are always enabled, and DISSLW on the SPI chips, which have no SDA
+    output.  Once armed, register writes are tracked for `restore`, and a
+    transaction that only succeeded after a retry is followed by
+    `check_reset`.
+    """
+    if not mcp._ports:
+        raise ValueError("Reset detection is not supported.")
+    mcp._track_registers()
+    address = _IOCON * mcp._ports
+    mcp._write_u8(address, mcp._read_u8(address) | mcp._IOCON_SENTINEL)
+    mcp._reset_detection = True
+    mcp._after_retry = _recover
+
+
+def check_reset(mcp: MCP23XXX) -> bool:
+    """Check the sentinel set by `arm_reset_detection` with one register
+    read.  If it was cleared, the chip was reset, and the known register
+    state is written back with `restore`.  Returns ``True`` if the chip was
+    reset.
+    """
+    if not mcp._reset_detection:
+        raise RuntimeError("Reset detection is not armed.")
+    if mcp._read_u8(_IOCON * mcp._ports) & mcp._IOCON_SENTINEL:
+        return False
+    restore(mcp)
+    return True
+
+
+def restore(mcp: MCP23XXX) -> None:
+    """Write the register state ``mcp`` knows of back to the chip, in a
+    single burst: OLAT first, so outputs come up at their latched levels,
+    then, as the address pointer rolls over, IODIR to GPPU.  Registers never
+    written since register tracking started (see `arm_reset_detection`) get
+    their power-on values.
+    """
+    ports = mcp._ports
+    if not ports:
+        raise ValueError("Restoring the register state is not supported.")
+    shadow = mcp._shadow
+    valid = mcp._shadow_valid
+    olat = _OLAT * ports
+    buf = bytearray(8 * ports)
+    for address in range(olat, olat + ports):
+        if valid >> address & 1:
+            buf[address - olat] = shadow[address]
+    iocon = _IOCON * ports
+    for address in range(_CONFIG_REGISTERS * ports):
+        # The MCP23x17 has one IOCON at two addresses.
+        source = iocon if address // ports == _IOCON else address
+        if valid >> source & 1:
+            value = shadow[source]
+        else:
+            value = 0xFF if address < ports else 0x00
+        if source == iocon and mcp._reset_detection:
+            value |= mcp._IOCON_SENTINEL
+        buf[ports + address] = value
+    mcp._write_from(olat, buf)
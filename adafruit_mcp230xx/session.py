@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`session`
+====================================================
+
+Holding the bus of one or more expanders for a run of register accesses,
+instead of locking it for each of them.
+
+.. code-block:: python
+
+    from adafruit_mcp230xx.session import commit, session
+
+    with session(mcp):
+        mcp.iodir = 0x0000
+        mcp.gppu = 0xFFFF
+        ...
+
+    commit((left, right), (0x00FF, 0xFF00))
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+from adafruit_bus_device import spi_device
+
+try:
+    from typing import Sequence, Union
+
+    from adafruit_bus_device import i2c_device
+    from busio import I2C, SPI
+
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+
+def _bus_of(device: Union[i2c_device.I2CDevice, spi_device.SPIDevice]) -> Union[I2C, SPI]:
+    if isinstance(device, spi_device.SPIDevice):
+        return device.spi
+    return device.i2c
+
+
+class _HeldDevice:
+    """Stands in for the bus device of a chip while a `_Session` holds its
+    bus.  Entering it doesn't lock the bus again; on SPI it configures the bus
+    if the previous chip needed other settings, and toggles the chip select.
+    """
+
+    def __init__(
+        self, device: Union[i2c_device.I2CDevice, spi_device.SPIDevice], session: "_Session"
+    ) -> None:
+        self._device = device
+        self._session = session
+        self._spi = device.spi if isinstance(device, spi_device.SPIDevice) else None
+
+    def __enter__(self) -> Union[i2c_device.I2CDevice, SPI]:
+        spi = self._spi
+        if spi is None:
+            # The I2CDevice transfer methods don't lock, only entering it does.
+            return self._device
+        device = self._device
+        settings = (device.baudrate, device.polarity, device.phase)
+        if self._session.settings != settings:
+            spi.configure(baudrate=settings[0], polarity=settings[1], phase=settings[2])
+            self._session.settings = settings
+        if device.chip_select:
+            device.chip_select.value = device.cs_active_value
+        return spi
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        device = self._device
+        if self._spi is not None and device.chip_select:
+            device.chip_select.value = not device.cs_active_value
+
+
+class _Session:
+    """Holds the bus shared by some chips locked while it is entered, so
+    their register accesses don't lock it (and configure it, on SPI) again.
+    Entering a session for chips that all are in one already does nothing.
+    """
+
+    def __init__(self, chips: Sequence[MCP23XXX]) -> None:
+        self._chips = tuple(chips)
+        self._bus = _bus_of(self._chips[0]._bus_device)
+        for chip in self._chips:
+            if _bus_of(chip._bus_device) is not self._bus:
+                raise ValueError("All chips must share one bus.")
+        self._nested = False
+        self.settings = None
+
+    def __enter__(self) -> "_Session":
+        held = [chip._held is not None for chip in self._chips]
+        if all(held):
+            self._nested = True
+            return self
+        if any(held):
+            raise ValueError("Some of the chips are already in a session.")
+        while not self._bus.try_lock():
+            time.sleep(0)
+        for chip in self._chips:
+            chip._held = _HeldDevice(chip._bus_device, self)
+            chip._bind_device()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        if self._nested:
+            return
+        for chip in self._chips:
+            chip._held = None
+            chip._bind_device()
+        self._bus.unlock()
+
+
+def session(*chips: MCP23XXX) -> _Session:
+    """Returns a context manager that holds the bus of ``chips`` locked, and
+    configured on SPI, for all their register accesses made inside it,
+    instead of locking it for each of them.  The chips must share one bus.
+
+    On SPI every access is still a command of its own, framed by the chip
+    select.  Other devices on the bus have to wait until the session ends,
+    and other threads must not use the chips meanwhile.  Sessions can be
+    nested.
+    """
+    if not chips:
+        raise ValueError("Expected at least one chip!")
+    return _Session(chips)
+
+
+def commit(chips: Sequence[MCP23XXX], values: Sequence[int]) -> None:
+    """Write the `gpio` output values of several chips, ``values[n]`` going
+    to ``chips[n]``, back-to-back.  The bus of the chips is locked once for
+    all of them (once per bus if they are on several), so other users of the
+    bus can't get in between and the skew between the chips is minimal.
+    """
+    if len(chips) != len(values):
+        raise ValueError("Expected one value per chip!")
+    groups = {}
+    for chip, value in zip(chips, values):
+        groups.setdefault(_bus_of(chip._bus_device), []).append((chip, value))
+    for group in groups.values():
+        with _Session([chip for chip, _ in group]):
+            for chip, value in group:
+                chip.gpio = value
@@ -0,0 +1,474 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`trace`
+====================================================
+
+Recording of bus transactions to a compact binary trace, and replay of a
+trace in place of the hardware.
+
+`RecordingI2C` and `RecordingSPI` wrap a bus and log every transfer the
+expanders issue through it, including failed ones.  `ReplayI2C` and
+`ReplaySPI` stand in for a bus and answer from a trace, so a driver run can
+be reproduced, or benchmarked, on a machine without the hardware:
+
+.. code-block:: python
+
+    with open("run.trace", "wb") as file:
+        mcp = MCP23017(RecordingI2C(board.I2C(), file))
+        ...
+
+    with open("run.trace", "rb") as file:
+        mcp = MCP23017(ReplayI2C(file))
+        ...
+
+`read_trace` decodes a trace, e.g. to diff the transactions of two library
+versions.
+
+The file starts with the magic ``b"MCPT"`` and a version byte.  Each
+transaction follows as a little-endian header of the microseconds elapsed
+since the previous one (``uint32``), the operation (``uint8``, bit 7 set if
+it failed), the device address (``uint8``, 0 for SPI), and the lengths of the
+data written and read (``uint16`` each), followed by that data.  A failed
+transaction carries its ``errno`` as the read data.
+
+* Author(s): Adafruit Industries
+"""
+
+import os
+import struct
+import time
+from collections import namedtuple
+
+from micropython import const
+
+try:
+    from typing import Any, BinaryIO, Iterator, Optional
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+OP_I2C_WRITE = const(1)
+OP_I2C_READ = const(2)
+OP_I2C_WRITE_READ = const(3)
+OP_SPI_CONFIGURE = const(4)
+OP_SPI_WRITE = const(5)
+OP_SPI_READ = const(6)
+OP_SPI_WRITE_READ = const(7)
+
+_MAGIC = b"MCPT"
+_VERSION = const(1)
+_FAILED = const(0x80)
+_HEADER = struct.Struct("<4sB")
+_RECORD = struct.Struct("<IBBHH")
+_ERRNO = struct.Struct("<H")
+_SPI_CONFIG = struct.Struct("<IBBB")
+
+TraceRecord = namedtuple(
+    "TraceRecord", ("timestamp", "op", "address", "data_out", "data_in", "failed")
+)
+"""One transaction of a trace.  ``timestamp`` is in microseconds since the
+start of the recording; ``failed`` is ``True`` if the transaction raised an
+`OSError`, whose errno is then the first element of ``data_in`` decoded as a
+``uint16``."""
+
+
+def _span(buf: ReadableBuffer, start: int, end: Optional[int]) -> memoryview:
+    return memoryview(buf)[start : len(buf) if end is None else end]
+
+
+def read_trace(file: BinaryIO) -> Iterator[TraceRecord]:
+    """Decode the transactions of a trace from a binary file, one
+    `TraceRecord` at a time.
+    """
+    magic, version = _HEADER.unpack(file.read(_HEADER.size))
+    if magic != _MAGIC:
+        raise ValueError("Not an MCP230xx trace file.")
+    if version != _VERSION:
+        raise ValueError(f"Unsupported trace version {version}.")
+    timestamp = 0
+    while True:
+        header = file.read(_RECORD.size)
+        if len(header) < _RECORD.size:
+            return
+        delta, op, address, out_length, in_length = _RECORD.unpack(header)
+        timestamp += delta
+        data_out = file.read(out_length)
+        data_in = file.read(in_length)
+        yield TraceRecord(timestamp, op & ~_FAILED, address, data_out, data_in, bool(op & _FAILED))
+
+
+class TraceWriter:
+    """Writes transactions to a binary file in the trace format.
+
+    :param BinaryIO file: A binary file open for writing.  The header is
+        written right away.
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+        file.write(_HEADER.pack(_MAGIC, _VERSION))
+        self._last = time.monotonic_ns()
+
+    def write(
+        self,
+        op: int,
+        address: int = 0,
+        data_out: ReadableBuffer = b"",
+        data_in: ReadableBuffer = b"",
+    ) -> None:
+        """Append one transaction, timestamped now."""
+        delta = min((time.monotonic_ns() - self._last) // 1000, 0xFFFFFFFF)
+        # Advance by the recorded delta so rounding doesn't accumulate.
+        self._last += delta * 1000
+        self._file.write(_RECORD.pack(delta, op, address, len(data_out), len(data_in)))
+        self._file.write(data_out)
+        self._file.write(data_in)
+
+    def write_failure(
+        self, op: int, address: int, data_out: ReadableBuffer, error: OSError
+    ) -> None:
+        """Append a transaction that raised ``error``."""
+        self.write(op | _FAILED, address, data_out, _ERRNO.pack(error.errno or 0))
+
+
+class _Recording:
+    def __init__(self, bus: Any, file: BinaryIO) -> None:
+        self._bus = bus
+        self.trace = TraceWriter(file)
+        """The `TraceWriter` the transactions go to."""
+
+    def __getattr__(self, name: str) -> Any:
+        # Locking, scanning, deinit etc. go straight to the wrapped bus.
+        return getattr(self._bus, name)
+
+    def __enter__(self) -> "_Recording":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self._bus.deinit()
+
+    def _record(self, op: int, address: int, data_out: bytes, function, *args, **kwargs) -> None:
+        try:
+            function(*args, **kwargs)
+        except OSError as error:
+            self.trace.write_failure(op, address, data_out, error)
+            raise
+
+
+class RecordingI2C(_Recording):
+    """Wraps an I2C bus and records every transfer to a trace.
+
+    :param ~busio.I2C i2c: The bus to wrap.
+    :param BinaryIO file: A binary file open for writing the trace to.
+    """
+
+    def writeto(
+        self,
+        address: int,
+        buffer: ReadableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Write the bytes from ``buffer`` to the device at ``address``."""
+        data = bytes(_span(buffer, start, end))
+        self._record(
+            OP_I2C_WRITE, address, data, self._bus.writeto, address, buffer, start=start, end=end
+        )
+        self.trace.write(OP_I2C_WRITE, address, data)
+
+    def readfrom_into(
+        self,
+        address: int,
+        buffer: WriteableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Read from the device at ``address`` into ``buffer``."""
+        self._record(
+            OP_I2C_READ,
+            address,
+            b"",
+            self._bus.readfrom_into,
+            address,
+            buffer,
+            start=start,
+            end=end,
+        )
+        self.trace.write(OP_I2C_READ, address, b"", _span(buffer, start, end))
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write the bytes from ``buffer_out`` to the device at ``address``,
+        then read into ``buffer_in`` after a repeated start.
+        """
+        data = bytes(_span(buffer_out, out_start, out_end))
+        self._record(
+            OP_I2C_WRITE_READ,
+            address,
+            data,
+            self._bus.writeto_then_readfrom,
+            address,
+            buffer_out,
+            buffer_in,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        self.trace.write(OP_I2C_WRITE_READ, address, data, _span(buffer_in, in_start, in_end))
+
+
+class RecordingSPI(_Recording):
+    """Wraps an SPI bus and records every transfer, and every `configure`
+    (i.e. the start of each chip select period), to a trace.
+
+    :param ~busio.SPI spi: The bus to wrap.
+    :param BinaryIO file: A binary file open for writing the trace to.
+    """
+
+    def configure(
+        self, *, baudrate: int = 100000, polarity: int = 0, phase: int = 0, bits: int = 8
+    ) -> None:
+        """Configure the SPI bus."""
+        self._bus.configure(baudrate=baudrate, polarity=polarity, phase=phase, bits=bits)
+        self.trace.write(OP_SPI_CONFIGURE, 0, _SPI_CONFIG.pack(baudrate, polarity, phase, bits))
+
+    def write(self, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Write the data contained in ``buffer``."""
+        data = bytes(_span(buffer, start, end))
+        self._record(OP_SPI_WRITE, 0, data, self._bus.write, buffer, start=start, end=end)
+        self.trace.write(OP_SPI_WRITE, 0, data)
+
+    def readinto(
+        self,
+        buffer: WriteableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        write_value: int = 0,
+    ) -> None:
+        """Read into ``buffer`` while writing ``write_value`` for each byte read."""
+        self._record(
+            OP_SPI_READ,
+            0,
+            b"",
+            self._bus.readinto,
+            buffer,
+            start=start,
+            end=end,
+            write_value=write_value,
+        )
+        self.trace.write(OP_SPI_READ, 0, b"", _span(buffer, start, end))
+
+    def write_readinto(
+        self,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write out the data in ``buffer_out`` while simultaneously reading
+        data into ``buffer_in``.
+        """
+        data = bytes(_span(buffer_out, out_start, out_end))
+        self._record(
+            OP_SPI_WRITE_READ,
+            0,
+            data,
+            self._bus.write_readinto,
+            buffer_out,
+            buffer_in,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        self.trace.write(OP_SPI_WRITE_READ, 0, data, _span(buffer_in, in_start, in_end))
+
+
+def _os_error(number: int) -> OSError:
+    # OSError only sets errno when given a message as well (on CPython), and
+    # MicroPython has no os.strerror.
+    try:
+        message = os.strerror(number)
+    except AttributeError:
+        message = ""
+    return OSError(number, message)
+
+
+class _Replay:
+    def __init__(self, file: BinaryIO, strict: bool = True) -> None:
+        # Load the whole trace up front so file access doesn't skew benchmarks.
+        self._records = list(read_trace(file))
+        self._index = 0
+        self._locked = False
+        self.strict = strict
+        """Whether every transaction must match the trace exactly, otherwise
+        the recorded data is returned in order regardless."""
+
+    def __enter__(self) -> "_Replay":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.deinit()
+
+    def deinit(self) -> None:
+        """Does nothing, for compatibility with the bus interface."""
+
+    def try_lock(self) -> bool:
+        """Attempt to grab the lock.  Returns ``True`` on success."""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Release the lock."""
+        self._locked = False
+
+    @property
+    def remaining(self) -> int:
+        """The number of transactions in the trace not replayed yet."""
+        return len(self._records) - self._index
+
+    def _next(self, op: int, address: int, data_out: ReadableBuffer, buffer_in=None) -> None:
+        if self._index >= len(self._records):
+            raise RuntimeError("End of trace reached.")
+        record = self._records[self._index]
+        self._index += 1
+        length = 0 if buffer_in is None else len(buffer_in)
+        if self.strict and (
+            record.op != op
+            or record.address != address
+            or record.data_out != bytes(data_out)
+            or (not record.failed and len(record.data_in) != length)
+        ):
+            raise RuntimeError(
+                f"Transaction {self._index - 1} at {record.timestamp} us differs from the trace."
+            )
+        if record.failed:
+            raise _os_error(_ERRNO.unpack_from(record.data_in)[0])
+        if length:
+            data = record.data_in[:length]
+            buffer_in[: len(data)] = data
+
+
+class ReplayI2C(_Replay):
+    """Stands in for an I2C bus, answering every transfer from a trace
+    recorded with `RecordingI2C`.
+
+    :param BinaryIO file: A binary file open for reading the trace from.
+    :param bool strict: Raise `RuntimeError` when a transfer doesn't match
+        the next one in the trace.
+    """
+
+    def writeto(
+        self,
+        address: int,
+        buffer: ReadableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Replay a write to the device at ``address``."""
+        self._next(OP_I2C_WRITE, address, _span(buffer, start, end))
+
+    def readfrom_into(
+        self,
+        address: int,
+        buffer: WriteableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Replay a read from the device at ``address`` into ``buffer``."""
+        self._next(OP_I2C_READ, address, b"", _span(buffer, start, end))
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Replay a write followed by a read after a repeated start."""
+        self._next(
+            OP_I2C_WRITE_READ,
+            address,
+            _span(buffer_out, out_start, out_end),
+            _span(buffer_in, in_start, in_end),
+        )
+
+
+class ReplaySPI(_Replay):
+    """Stands in for an SPI bus, answering every transfer from a trace
+    recorded with `RecordingSPI`.
+
+    :param BinaryIO file: A binary file open for reading the trace from.
+    :param bool strict: Raise `RuntimeError` when a transfer doesn't match
+        the next one in the trace.
+    """
+
+    def configure(
+        self, *, baudrate: int = 100000, polarity: int = 0, phase: int = 0, bits: int = 8
+    ) -> None:
+        """Replay a bus configuration."""
+        self._next(OP_SPI_CONFIGURE, 0, _SPI_CONFIG.pack(baudrate, polarity, phase, bits))
+
+    def write(self, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Replay a write of ``buffer``."""
+        self._next(OP_SPI_WRITE, 0, _span(buffer, start, end))
+
+    def readinto(
+        self,
+        buffer: WriteableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        write_value: int = 0,
+    ) -> None:
+        """Replay a read into ``buffer``."""
+        self._next(OP_SPI_READ, 0, b"", _span(buffer, start, end))
+
+    def write_readinto(
+        self,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Replay a simultaneous write and read."""
+        self._next(
+            OP_SPI_WRITE_READ,
+            0,
+            _span(buffer_out, out_start, out_end),
+            _span(buffer_in, in_start, in_end),
+        )
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`virtual_gpio`
+====================================================
+
+A single GPIO address space spanning many expanders on several buses.
+
+Global pin numbers are assigned bus by bus, chip by chip, in the order the
+chips are given, 16 pins for each MCP23x17/MCP23016 and 8 pins for each
+MCP23x08.  Whole-space reads and writes are spread over one worker thread per
+bus, so a full scan takes as long as the slowest bus rather than the sum of
+all chips.
+
+This module uses threads and is meant for CPython (e.g. Blinka on Linux).
+
+* Author(s): Adafruit Industries
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from adafruit_mcp230xx.mcp23xxx import _give_own_buffers
+
+try:
+    from typing import List, Optional, Sequence, Tuple
+
+    from adafruit_mcp230xx.digital_inout import DigitalInOut
+    from adafruit_mcp230xx.mcp23xxx import MCP23XXX
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP230xx.git"
+
+
+def _chip_width(chip: MCP23XXX) -> int:
+    # Only the 16 pin expanders have separate port A/B registers.
+    return 16 if hasattr(chip, "gpioa") else 8
+
+
+class _Bus:
+    """The chips sharing one bus, their place in the global space and the
+    lock serializing access to them.
+    """
+
+    def __init__(self, chips: Sequence[MCP23XXX], offset: int) -> None:
+        self.chips = list(chips)
+        self.offsets = []
+        self.widths = []
+        for chip in self.chips:
+            _give_own_buffers(chip)
+            self.offsets.append(offset)
+            self.widths.append(_chip_width(chip))
+            offset += self.widths[-1]
+        self.start = self.offsets[0] if self.chips else offset
+        self.end = offset
+        self.mask = ((1 << self.end) - 1) ^ ((1 << self.start) - 1)
+        self.lock = threading.Lock()
+
+    def read(self) -> int:
+        value = 0
+        with self.lock:
+            for chip, offset in zip(self.chips, self.offsets):
+                value |= chip.gpio << offset
+        return value
+
+    def write(self, value: int, mask: int) -> None:
+        with self.lock:
+            for chip, offset, width in zip(self.chips, self.offsets, self.widths):
+                full = (1 << width) - 1
+                chip_mask = (mask >> offset) & full
+                if not chip_mask:
+                    continue
+                chip_value = (value >> offset) & chip_mask
+                if chip_mask != full:
+                    # Only some pins of this chip change, keep the others.
+                    chip_value |= chip.gpio & ~chip_mask
+                chip.gpio = chip_value
+
+
+class VirtualGPIO:
+    """Maps global pin numbers onto the pins of many expanders and reads and
+    writes bit masks across the whole space.
+
+    :param Sequence[Sequence[MCP23XXX]] buses: The expanders, grouped by the
+        bus they are on.  Each group is polled by its own worker thread.
+
+    Call `deinit` (or use the object as a context manager) to stop the
+    worker threads.
+    """
+
+    def __init__(self, buses: Sequence[Sequence[MCP23XXX]]) -> None:
+        self._buses = []
+        offset = 0
+        for chips in buses:
+            bus = _Bus(chips, offset)
+            self._buses.append(bus)
+            offset = bus.end
+        self._pin_count = offset
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self._buses)))
+
+    def __enter__(self) -> "VirtualGPIO":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.deinit()
+
+    def deinit(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown()
+
+    @property
+    def pin_count(self) -> int:
+        """The number of pins in the whole space."""
+        return self._pin_count
+
+    def locate(self, pin: int) -> Tuple[MCP23XXX, int]:
+        """Returns the expander a global pin number belongs to and the pin
+        number on that expander.
+        """
+        if not 0 <= pin < self._pin_count:
+            raise ValueError(f"Pin number must be 0-{self._pin_count - 1}.")
+        for bus in self._buses:
+            if bus.start <= pin < bus.end:
+                for chip, offset, width in zip(bus.chips, bus.offsets, bus.widths):
+                    if offset <= pin < offset + width:
+                        return chip, pin - offset
+        raise ValueError(f"Pin number must be 0-{self._pin_count - 1}.")
+
+    def get_pin(self, pin: int) -> DigitalInOut:
+        """Convenience function to create an instance of the DigitalInOut
+        class pointing at the specified global pin.
+        """
+        chip, chip_pin = self.locate(pin)
+        return chip.get_pin(chip_pin)
+
+    def _run(self, buses: List[_Bus], function, *args) -> List:
+        if len(buses) == 1:
+            return [function(buses[0], *args)]
+        futures = [self._executor.submit(function, bus, *args) for bus in buses]
+        return [future.result() for future in futures]
+
+    def read(self, mask: Optional[int] = None) -> int:
+        """Returns the GPIO state of the whole space as one integer, bit ``n``
+        being global pin ``n``.  With a ``mask`` only the buses holding the
+        selected pins are read and all other bits are zero.
+        """
+        if mask is None:
+            buses = self._buses
+            mask = (1 << self._pin_count) - 1
+        else:
+            buses = [bus for bus in self._buses if bus.mask & mask]
+        value = 0
+        for bus_value in self._run(buses, _Bus.read):
+            value |= bus_value
+        return value & mask
+
+    def write(self, value: int, mask: Optional[int] = None) -> None:
+        """Write the GPIO output state of the pins selected by ``mask`` (all
+        pins by default), bit ``n`` being global pin ``n``.  Chips that are
+        only partially selected are updated with a read-modify-write.
+        """
+        if mask is None:
+            mask = (1 << self._pin_count) - 1
+        buses = [bus for bus in self._buses if bus.mask & mask]
+        self._run(buses, _Bus.write, value, mask)
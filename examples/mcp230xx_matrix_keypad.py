@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import board
+import busio
+from digitalio import DigitalInOut
+
+from adafruit_mcp230xx.matrix_keypad import MatrixKeypad
+from adafruit_mcp230xx.mcp23017 import MCP23017
+
+# Initialize the I2C bus:
+i2c = busio.I2C(board.SCL, board.SDA)
+
+# Initialize the MCP23017 chip on the bonnet
+mcp = MCP23017(i2c)
+
+# A 4x4 keypad with its rows on pins 0-3 (port A) and its columns on
+# pins 8-11 (port B).  Connect the INTB pin to D4 so an idle keypad
+# needs no I2C traffic at all.
+irq_b = DigitalInOut(board.D4)
+keys = MatrixKeypad(mcp, row_pins=(0, 1, 2, 3), column_pins=(8, 9, 10, 11), interrupt=irq_b)
+
+while True:
+    keys.update()
+    event = keys.events.get()
+    if event:
+        print(event)
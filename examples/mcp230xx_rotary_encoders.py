@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import board
+import busio
+from digitalio import DigitalInOut, Pull
+
+from adafruit_mcp230xx.incremental_encoder import IncrementalEncoders
+from adafruit_mcp230xx.mcp23017 import MCP23017
+
+# Initialize the I2C bus:
+i2c = busio.I2C(board.SCL, board.SDA)
+
+# Initialize the MCP23017 chip on the bonnet
+mcp = MCP23017(i2c)
+# Mirror INTA and INTB so one host pin sees interrupts from both ports, and
+# make the interrupt pin open drain.
+mcp.io_control = 0x44
+
+# Two encoders, on pins 0/1 and 8/9, with the interrupt pin connected to D4.
+irq = DigitalInOut(board.D4)
+irq.pull = Pull.UP  # The open drain interrupt pin needs a pull-up.
+encoders = IncrementalEncoders(mcp, ((0, 1), (8, 9)), interrupt=irq)
+
+last_positions = None
+while True:
+    encoders.update()
+    positions = [encoder.position for encoder in encoders]
+    if positions != last_positions:
+        print(positions)
+        last_positions = positions